@@ -5,10 +5,11 @@ from pydantic import BaseModel
 from typing import Optional, Dict, Any
 from uuid import uuid4
 
+from app.services.agent.job_store import get_job_store
 from app.services.agent.orchestrator import (
     AgentOrchestrator,
-    BrandGuardPipeline,
-    pipeline_jobs,
+    get_orchestrator,
+    get_pipeline,
     get_task,
     store_task,
     list_tasks,
@@ -17,8 +18,6 @@ from app.services.agent.orchestrator import (
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-pipeline = BrandGuardPipeline()
-
 
 class PipelineRunRequest(BaseModel):
     """Request to trigger the full monitoring pipeline."""
@@ -43,29 +42,30 @@ async def run_pipeline(request: PipelineRunRequest, background_tasks: Background
     # If we only got an ID, try to fetch the data (mocked for now)
     mention_data = request.mention_data or {"id": request.mention_id, "content": "mock mention text", "brand_id": "mock_brand"}
 
-    background_tasks.add_task(pipeline.process_mention, mention_data, job_id)
+    background_tasks.add_task(get_pipeline().process_mention, mention_data, job_id)
     return {"job_id": job_id, "status": "queued"}
 
 @router.get("/pipeline/status/{job_id}")
 async def get_pipeline_status(job_id: str):
     """Check pipeline progress and get results."""
-    if job_id not in pipeline_jobs:
+    job = await get_job_store().get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    return pipeline_jobs[job_id]
+    return job
 
 @router.post("/pipeline/investigate")
 async def investigate_mention(request: PipelineInvestigateRequest, background_tasks: BackgroundTasks):
     """Trigger a deep investigation for a flagged mention."""
     job_id = str(uuid4())
-    background_tasks.add_task(pipeline.investigate, request.mention_id, job_id)
+    background_tasks.add_task(get_pipeline().investigate, request.mention_id, job_id)
     return {"job_id": job_id, "status": "queued"}
 
 @router.post("/pipeline/remediate")
 async def remediate_mention(request: PipelineRemediateRequest, background_tasks: BackgroundTasks):
     """Trigger a remediation content generation for a flagged mention."""
     job_id = str(uuid4())
-    background_tasks.add_task(pipeline.remediate, request.mention_id, request.brand_id, job_id)
+    background_tasks.add_task(get_pipeline().remediate, request.mention_id, request.brand_id, job_id)
     return {"job_id": job_id, "status": "queued"}
 
 
@@ -85,7 +85,7 @@ class AgentTaskRequest(BaseModel):
 
 def _orchestrator() -> AgentOrchestrator:
     try:
-        return AgentOrchestrator()
+        return get_orchestrator()
     except Exception as exc:
         raise HTTPException(status_code=503, detail=f"Agent unavailable: {exc}")
 
@@ -6,7 +6,8 @@ from pydantic import BaseModel
 import logging
 
 from app.services.senso.client import SensoGEOClient, SensoSDKClient
-from app.services.modulate.client import ModulateService
+from app.services.modulate.client import AudioTooLargeError, ModulateService
+from app.services.providers import get_modulate, get_senso_geo, get_senso_sdk
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -74,8 +75,10 @@ class SetupRulesResponse(BaseModel):
 
 
 # Initialize clients
-geo_client = SensoGEOClient()
-sdk_client = SensoSDKClient()
+geo_client: SensoGEOClient = get_senso_geo()
+sdk_client: SensoSDKClient = get_senso_sdk()
+# Shared so audio uploads reuse one pooled connection; closed on app shutdown
+modulate_service: ModulateService = get_modulate()
 
 
 @router.post("/evaluate", response_model=EvaluateResponse)
@@ -232,10 +235,10 @@ async def senso_webhook(request: Request, background_tasks: BackgroundTasks):
         mention_id = payload.get("id", "unknown_mention")
 
         # 2. Enqueue investigation job
-        from app.services.agent.orchestrator import BrandGuardPipeline
+        from app.services.agent.orchestrator import get_pipeline
         from uuid import uuid4
 
-        pipeline = BrandGuardPipeline()
+        pipeline = get_pipeline()
         job_id = str(uuid4())
 
         # Start investigate
@@ -257,7 +260,8 @@ async def analyze_audio(
     brand_name: str = Form(..., description="Brand name to search for in the transcript"),
     speaker_diarization: bool = Form(True, description="Enable per-speaker labelling"),
     emotion_signal: bool = Form(True, description="Enable emotion detection per utterance"),
-    fast_english: bool = Form(False, description="Use the English-optimised fast model"),
+    fast_english: Optional[bool] = Form(None, description="Force the English-optimised fast model on/off"),
+    language: Optional[str] = Form(None, description="Spoken-language hint; 'en' selects the fast model"),
 ) -> dict[str, Any]:
     """Transcribe an audio file using Modulate Velma-2 and extract brand mentions.
 
@@ -265,19 +269,21 @@ async def analyze_audio(
     utterances that contain the brand name — each annotated with speaker ID,
     emotion, accent, and timestamps.
     """
-    audio_bytes = await file.read()
     filename = file.filename or "audio.mp3"
 
-    service = ModulateService()
     try:
-        result = await service.analyze_audio(
-            audio_bytes=audio_bytes,
+        # Stream the spooled upload straight through instead of reading it all
+        result = await modulate_service.analyze_audio(
+            audio=file.file,
             filename=filename,
             brand_name=brand_name,
             speaker_diarization=speaker_diarization,
             emotion_signal=emotion_signal,
             fast_english=fast_english,
+            language=language,
         )
+    except AudioTooLargeError as exc:
+        raise HTTPException(status_code=413, detail=str(exc)) from exc
     except RuntimeError as exc:
         raise HTTPException(status_code=502, detail=str(exc)) from exc
 
@@ -27,6 +27,7 @@ class StoreMentionRequest(BaseModel):
 
 class StoreCorrectionRequest(BaseModel):
     mention_id: str
+    brand_id: Optional[str] = None
     id: Optional[str] = None
     content: str = ""
     correction_type: str = "blog_post"
@@ -80,6 +81,8 @@ async def store_correction(request: StoreCorrectionRequest):
     try:
         result = await client.store_correction(request.model_dump())
         return result
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
     except Exception as exc:
         logger.error("store_correction failed: %s", exc)
         raise HTTPException(status_code=500, detail=str(exc))
@@ -7,6 +7,7 @@ from pydantic import BaseModel
 import httpx
 
 from app.services.yutori.client import YutoriClient, PLATFORM_URLS, NO_AUTH_PLATFORMS
+from app.services.providers import get_yutori
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -39,7 +40,7 @@ class ResearchTaskStatusRequest(BaseModel):
 
 def _yutori() -> YutoriClient:
     try:
-        return YutoriClient()
+        return get_yutori()
     except ValueError as exc:
         raise HTTPException(status_code=503, detail=str(exc))
 
@@ -1,4 +1,7 @@
 """Monitoring endpoints — Yutori scouts, Tavily web searches, and webhook receiver."""
+import asyncio
+import hashlib
+import hmac
 import logging
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
 from pydantic import BaseModel
@@ -7,15 +10,26 @@ from typing import Optional
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
+from app.config import settings
 from app.services.yutori.client import YutoriClient, BRAND_MENTION_SCHEMA
 from app.services.neo4j.client import get_neo4j_client
+from app.services.providers import get_senso_geo, get_yutori
+from app.services.yutori.mentions import evaluation_score, graph_mention, scout_mentions
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# In-memory scout↔brand mapping (sufficient for hackathon demo)
-_scout_to_brand: dict[str, dict] = {}  # scout_id -> {"brand_id": ..., "brand_name": ...}
+# scout_id -> {"brand_id": ..., "brand_name": ...}; the Scout-[:MONITORS]->Brand
+# edge in Neo4j is the durable copy, this just saves a read per webhook
+_scout_to_brand: dict[str, dict] = {}
+
+# Scout webhook payloads waiting for the mention worker; full queue -> 503 so Yutori retries
+MENTION_QUEUE_SIZE = 1000
+# Mentions evaluated/stored at once by the worker
+MENTION_WORKER_CONCURRENCY = 8
+_SIGNATURE_HEADER = "X-Yutori-Signature"
 
 
 # ── Request Models ──────────────────────────────────────────────
@@ -35,13 +49,46 @@ class StopMonitoringRequest(BaseModel):
 
 def _yutori() -> YutoriClient:
     try:
-        return YutoriClient()
+        return get_yutori()
     except ValueError as exc:
         raise HTTPException(status_code=503, detail=str(exc))
 
 
-def _severity_score(severity: str) -> float:
-    return {"critical": 10, "high": 30, "medium": 55, "low": 80}.get(severity, 50)
+async def _brand_for(body: dict) -> dict:
+    """Brand a scout payload belongs to, from the scout's link in Neo4j."""
+    scout_id = body.get("scout_id") or body.get("task_id", "")
+    brand = _scout_to_brand.get(scout_id)
+    if brand is None and scout_id:
+        try:
+            brand = await get_neo4j_client().get_scout_brand(scout_id)
+        except Exception as exc:
+            logger.warning("Scout brand lookup failed for %s: %s", scout_id, exc)
+        if brand is not None:
+            _scout_to_brand[scout_id] = brand
+    return brand or {
+        "brand_id": body.get("brand_id", "acme-corp"),
+        "brand_name": body.get("brand_name", "Acme Corp"),
+    }
+
+
+async def _unlink_scout(scout_id: str) -> None:
+    """Forget a scout's brand, in memory and in Neo4j."""
+    _scout_to_brand.pop(scout_id, None)
+    try:
+        await get_neo4j_client().unlink_scout(scout_id)
+    except Exception as exc:
+        logger.warning("Failed to unlink scout %s: %s", scout_id, exc)
+
+
+def _valid_signature(raw_body: bytes, signature: str | None) -> bool:
+    """Check a hex HMAC-SHA256 of the raw body (``sha256=`` prefix optional)."""
+    secret = settings.YUTORI_WEBHOOK_SECRET
+    if not secret:
+        return True
+    if not signature:
+        return False
+    expected = hmac.new(secret.encode(), raw_body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature.removeprefix("sha256="))
 
 
 # ── Endpoints ───────────────────────────────────────────────────
@@ -63,20 +110,26 @@ async def start_monitoring(request: StartMonitoringRequest):
             output_schema=BRAND_MENTION_SCHEMA,
             output_interval=request.interval,
             skip_email=True,
-            webhook_url=request.webhook_url,
+            webhook_url=request.webhook_url or settings.PUBLIC_WEBHOOK_URL or None,
         )
-        scout_id = result.get("id", "")
-        _scout_to_brand[scout_id] = {
-            "brand_id": request.brand_id,
-            "brand_name": request.brand_name,
-        }
-        return {"scout_id": scout_id, "status": "active"}
     except httpx.HTTPStatusError as exc:
         logger.error("Yutori create_scout error: %s", exc.response.text)
         raise HTTPException(status_code=exc.response.status_code, detail=exc.response.text)
     except httpx.RequestError as exc:
         raise HTTPException(status_code=502, detail="Failed to reach Yutori API")
 
+    scout_id = result.get("id", "")
+    _scout_to_brand[scout_id] = {
+        "brand_id": request.brand_id,
+        "brand_name": request.brand_name,
+    }
+    try:
+        await get_neo4j_client().link_scout(scout_id, request.brand_id, request.brand_name)
+    except Exception as exc:
+        # The scout already exists; the cron can't attribute its updates until linked
+        logger.error("Failed to link scout %s to brand %s: %s", scout_id, request.brand_id, exc)
+    return {"scout_id": scout_id, "status": "active"}
+
 
 @router.post("/stop")
 async def stop_monitoring(request: StopMonitoringRequest):
@@ -84,12 +137,12 @@ async def stop_monitoring(request: StopMonitoringRequest):
     client = _yutori()
     try:
         await client.stop_scout(request.scout_id)
-        _scout_to_brand.pop(request.scout_id, None)
-        return {"status": "stopped"}
     except httpx.HTTPStatusError as exc:
         raise HTTPException(status_code=exc.response.status_code, detail=exc.response.text)
     except httpx.RequestError:
         raise HTTPException(status_code=502, detail="Failed to reach Yutori API")
+    await _unlink_scout(request.scout_id)
+    return {"status": "stopped"}
 
 
 @router.get("/status")
@@ -134,11 +187,12 @@ async def delete_scout(scout_id: str):
     client = _yutori()
     try:
         await client.delete_scout(scout_id)
-        return {"status": "deleted"}
     except httpx.HTTPStatusError as exc:
         raise HTTPException(status_code=exc.response.status_code, detail=exc.response.text)
     except httpx.RequestError:
         raise HTTPException(status_code=502, detail="Failed to reach Yutori API")
+    await _unlink_scout(scout_id)
+    return {"status": "deleted"}
 
 
 # ── Webhook Receiver ────────────────────────────────────────────
@@ -154,50 +208,30 @@ async def crawl_url(url: str):
 async def yutori_webhook(request: Request, background_tasks: BackgroundTasks):
     """Receive scout update webhooks from Yutori, parse mentions, store in Neo4j, and trigger pipeline."""
     from uuid import uuid4
-    from app.services.agent.orchestrator import BrandGuardPipeline
+    from app.services.agent.orchestrator import get_pipeline
 
     body = await request.json()
     logger.info("Yutori webhook received: %s", str(body)[:200])
 
-    scout_id = body.get("scout_id") or body.get("task_id", "")
-    brand_info = _scout_to_brand.get(scout_id, {
-        "brand_id": body.get("brand_id", "acme-corp"),
-        "brand_name": body.get("brand_name", "Acme Corp"),
-    })
-
-    structured = body.get("structured_result") or body.get("result", {})
-    mentions = []
-    if isinstance(structured, dict):
-        mentions = structured.get("brand_mentions", [])
-    elif isinstance(structured, str):
-        return {"received": True, "parsed_mentions": 0, "note": "Unstructured result"}
+    brand_info = await _brand_for(body)
+    items = scout_mentions(body)
+    mentions = [m for _, m in items]
 
     # Store mentions in Neo4j
     stored = 0
     try:
         neo4j = get_neo4j_client()
-        for m in mentions:
-            score = _severity_score(m.get("severity", "medium"))
-            if m.get("accuracy") == "accurate":
-                score = max(score, 80)
-            elif m.get("accuracy") == "inaccurate":
-                score = min(score, 40)
-
-            await neo4j.store_mention({
-                "brand_id": brand_info["brand_id"],
-                "brand_name": brand_info["brand_name"],
-                "platform": m.get("platform", "unknown"),
-                "claim": m.get("claim", ""),
-                "accuracy_score": score,
-                "severity": m.get("severity", "medium"),
-                "source_urls": [m["source_url"]] if m.get("source_url") else [],
-            })
+        for mention_id, m in items:
+            mention = graph_mention(m, brand_info, mention_id=mention_id)
+            if mention is None:
+                continue
+            await neo4j.store_mention(mention)
             stored += 1
     except Exception as exc:
         logger.error("Failed to store webhook mentions in Neo4j: %s", exc)
 
     # Trigger pipeline for each mention
-    pipeline = BrandGuardPipeline()
+    pipeline = get_pipeline()
     job_ids = []
     for mention in mentions:
         job_id = str(uuid4())
@@ -211,3 +245,80 @@ async def yutori_webhook(request: Request, background_tasks: BackgroundTasks):
         "jobs_started": len(job_ids),
         "job_ids": job_ids,
     }
+
+
+@router.post("/webhooks/yutori/scout", status_code=202)
+async def yutori_scout_webhook(request: Request):
+    """Accept a scout update push and queue it for the mention worker.
+
+    Returns as soon as the payload is queued; evaluation and storage happen
+    in ``run_mention_worker``, started with the app.
+    """
+    raw = await request.body()
+    if not _valid_signature(raw, request.headers.get(_SIGNATURE_HEADER)):
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+
+    # Malformed payloads get a 400 so Yutori doesn't keep redelivering them
+    try:
+        body = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Webhook body is not valid JSON")
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=400, detail="Webhook body must be a JSON object")
+
+    queue: asyncio.Queue | None = getattr(request.app.state, "mention_queue", None)
+    if queue is None:
+        raise HTTPException(status_code=503, detail="Mention worker not running")
+    try:
+        queue.put_nowait(body)
+    except asyncio.QueueFull:
+        raise HTTPException(status_code=503, detail="Mention queue full, retry later")
+    return {"queued": True}
+
+
+async def run_mention_worker(queue: asyncio.Queue) -> None:
+    """Drain scout payloads: Senso-evaluate each mention, then store it.
+
+    Mentions are handled concurrently, at most MENTION_WORKER_CONCURRENCY
+    at a time.
+    """
+    sem = asyncio.Semaphore(MENTION_WORKER_CONCURRENCY)
+    pending: set[asyncio.Task] = set()
+
+    async def handle(m: dict, brand_info: dict, mention_id: str | None) -> None:
+        try:
+            try:
+                evaluation = await get_senso_geo().evaluate(
+                    query=m["claim"],
+                    brand=brand_info["brand_name"],
+                    network=m.get("platform") or "web",
+                )
+            except Exception as exc:
+                # Still store the mention, scored from the scout's own labels
+                logger.warning("Scout mention evaluate failed: %s", exc)
+                evaluation = None
+            mention = graph_mention(m, brand_info, evaluation_score(evaluation), mention_id)
+            if mention is not None:
+                await get_neo4j_client().store_mention(mention)
+        except Exception as exc:
+            logger.error("Scout mention store failed: %s", exc)
+        finally:
+            sem.release()
+
+    while True:
+        body = await queue.get()
+        try:
+            items = scout_mentions(body)
+            if not items:
+                continue
+            brand_info = await _brand_for(body)
+            for mention_id, m in items:
+                # Wait for a free slot before spawning so a burst backs up in the queue
+                await sem.acquire()
+                task = asyncio.create_task(handle(m, brand_info, mention_id))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        except Exception as exc:
+            logger.error("Failed to process scout webhook payload: %s", exc)
+        finally:
+            queue.task_done()
@@ -1,15 +1,21 @@
 """FastAPI application and route definitions for BrandGuard."""
+import asyncio
+import logging
 import os
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.monitoring import router as monitoring_router
+from app.api.monitoring import MENTION_QUEUE_SIZE, router as monitoring_router, run_mention_worker
 from app.api.analysis import router as analysis_router
 from app.api.graph import router as graph_router
 from app.api.agent import router as agent_router
 from app.api.search import router as search_router
 from app.api.investigate import router as investigate_router
+from app.config import settings
+from app.services.providers import close_clients, warm_clients
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="BrandGuard API",
@@ -43,6 +49,60 @@ app.include_router(search_router, prefix="/api/search", tags=["search"])
 app.include_router(investigate_router, prefix="/api/investigate", tags=["investigate"])
 
 
+@app.on_event("startup")
+async def enable_perf_debugging():
+    """Flag blocking calls on the event loop when DEBUG_PERF is set.
+
+    Any callback that holds the loop for more than 50 ms is logged by asyncio,
+    which surfaces sync work hidden inside an ``await``ed client call. If
+    ddtrace is installed, its profiler is started as well so task/stack
+    samples can be correlated with the slow callbacks.
+    """
+    if not settings.DEBUG_PERF:
+        return
+
+    loop = asyncio.get_running_loop()
+    loop.set_debug(True)
+    loop.slow_callback_duration = 0.05
+    logger.info("Perf debugging enabled on %s", type(loop).__name__)
+
+    try:
+        from ddtrace.profiling import Profiler
+    except ImportError:
+        logger.info("ddtrace not installed; skipping profiler")
+        return
+    # Started after the loop exists so uvloop task creation is captured too.
+    Profiler().start()
+
+
+@app.on_event("startup")
+async def start_mention_worker():
+    # Yutori scout webhooks enqueue here; the worker evaluates and stores them
+    app.state.mention_queue = asyncio.Queue(maxsize=MENTION_QUEUE_SIZE)
+    app.state.mention_worker = asyncio.create_task(run_mention_worker(app.state.mention_queue))
+
+
+@app.on_event("startup")
+async def warm_service_clients():
+    await warm_clients()
+
+
+@app.on_event("shutdown")
+async def stop_mention_worker():
+    worker = getattr(app.state, "mention_worker", None)
+    if worker is not None:
+        worker.cancel()
+        try:
+            await worker
+        except asyncio.CancelledError:
+            pass
+
+
+@app.on_event("shutdown")
+async def close_service_clients():
+    await close_clients()
+
+
 @app.get("/")
 async def root():
     return {"service": "BrandGuard API", "version": "0.1.0", "status": "running"}
@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field
 import httpx
 
 from app.services.tavily.client import TavilyClient, analyze_claim_sources
+from app.services.providers import get_tavily
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -54,7 +55,7 @@ class AnalyzeClaimRequest(BaseModel):
 
 def _tavily_client() -> TavilyClient:
     try:
-        return TavilyClient()
+        return get_tavily()
     except ValueError as exc:
         raise HTTPException(status_code=503, detail=str(exc))
 
@@ -173,6 +174,7 @@ async def analyze_claim(request: AnalyzeClaimRequest):
         result = await analyze_claim_sources(
             claim=request.claim,
             brand=request.brand,
+            client=get_tavily(),
         )
         return result
     except httpx.HTTPStatusError as exc:
@@ -12,32 +12,74 @@ class Settings:
     HOST: str = os.getenv("HOST", "0.0.0.0")
     PORT: int = int(os.getenv("PORT", "8000"))
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
+    # Event-loop slow-callback detection + profiler hooks (see app.api.routes)
+    DEBUG_PERF: bool = os.getenv("DEBUG_PERF", "false").lower() == "true"
 
     # Senso API - content evaluation, rules engine, generation
     SENSO_GEO_API_KEY: str = os.getenv("SENSO_GEO_API_KEY", "")
     SENSO_SDK_API_KEY: str = os.getenv("SENSO_SDK_API_KEY", "")
     SENSO_API_BASE_URL: str = os.getenv("SENSO_API_BASE_URL", "https://api.senso.ai")
+    SENSO_MAX_CONCURRENCY: int = int(os.getenv("SENSO_MAX_CONCURRENCY", "5"))
+    SENSO_CACHE_TTL: float = float(os.getenv("SENSO_CACHE_TTL", "300"))
+    SENSO_CACHE_MAX_ENTRIES: int = int(os.getenv("SENSO_CACHE_MAX_ENTRIES", "2048"))
 
     # Tavily API - web search, crawl, research
     TAVILY_API_KEY: str = os.getenv("TAVILY_API_KEY", "")
+    # Client-side request budget per minute (0 disables)
+    TAVILY_RPM_LIMIT: int = int(os.getenv("TAVILY_RPM_LIMIT", "100"))
+    # Seconds identical search/extract calls are served from memory (0 disables)
+    TAVILY_CACHE_TTL: float = float(os.getenv("TAVILY_CACHE_TTL", "600"))
+    TAVILY_CACHE_MAX_ENTRIES: int = int(os.getenv("TAVILY_CACHE_MAX_ENTRIES", "1024"))
 
     # Neo4j - graph database for entity relationships
     NEO4J_URI: str = os.getenv("NEO4J_URI", "bolt://localhost:7687")
     NEO4J_USER: str = os.getenv("NEO4J_USER", "neo4j")
     NEO4J_PASSWORD: str = os.getenv("NEO4J_PASSWORD", "")
+    NEO4J_DATABASE: str = os.getenv("NEO4J_DATABASE", "neo4j")
+    # Driver connection pool (sized for bursty request fan-out)
+    NEO4J_POOL_SIZE: int = int(os.getenv("NEO4J_POOL_SIZE", "50"))
+    NEO4J_ACQUIRE_TIMEOUT: float = float(os.getenv("NEO4J_ACQUIRE_TIMEOUT", "30"))
+    NEO4J_MAX_CONNECTION_LIFETIME: float = float(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600"))
+    # Seconds a brand-health read is reused by chat (0 disables)
+    CHAT_HEALTH_CACHE_TTL: float = float(os.getenv("CHAT_HEALTH_CACHE_TTL", "5"))
+    # Seconds brand health/sources/network reads are reused (0 disables)
+    NEO4J_READ_CACHE_TTL: float = float(os.getenv("NEO4J_READ_CACHE_TTL", "30"))
 
     # Yutori - scouting and browsing agent
     YUTORI_API_KEY: str = os.getenv("YUTORI_API_KEY", "")
     YUTORI_API_BASE_URL: str = os.getenv("YUTORI_API_BASE_URL", "https://api.yutori.com")
+    # Client-side request budget per minute (0 disables)
+    YUTORI_RPM_LIMIT: int = int(os.getenv("YUTORI_RPM_LIMIT", "60"))
+    # Public URL of POST /api/monitoring/webhooks/yutori/scout, passed to new scouts
+    PUBLIC_WEBHOOK_URL: str = os.getenv("PUBLIC_WEBHOOK_URL", "")
+    # Shared secret for the scout webhook's HMAC signature (empty skips the check)
+    YUTORI_WEBHOOK_SECRET: str = os.getenv("YUTORI_WEBHOOK_SECRET", "")
 
     # Modulate - voice/audio transcription and analysis (Velma-2)
     MODULATE_API_KEY: str = os.getenv("MODULATE_API_KEY", "")
     MODULATE_API_BASE_URL: str = os.getenv("MODULATE_API_BASE_URL", "https://modulate-developer-apis.com")
+    # Uploads above this size are rejected locally instead of sent to the API
+    MODULATE_MAX_BYTES: int = int(os.getenv("MODULATE_MAX_BYTES", str(100 * 1024 * 1024)))
+    MODULATE_MAX_CONCURRENCY: int = int(os.getenv("MODULATE_MAX_CONCURRENCY", "8"))
+    # Transcripts are cached by audio hash; entries can be large, keep the cap low
+    MODULATE_CACHE_TTL: float = float(os.getenv("MODULATE_CACHE_TTL", "600"))
+    MODULATE_CACHE_MAX_ENTRIES: int = int(os.getenv("MODULATE_CACHE_MAX_ENTRIES", "64"))
 
     # OpenAI - for agent orchestration LLM
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o")
 
+    # Hard deadline for AgentOrchestrator.run_full_scan, in seconds
+    SCAN_TIMEOUT_S: float = float(os.getenv("SCAN_TIMEOUT_S", "120"))
+
+    # Sleep STUB_DELAY seconds in pipeline steps that are still placeholders
+    DEV_SIMULATE_WORK: bool = os.getenv("DEV_SIMULATE_WORK", "false").lower() == "true"
+    STUB_DELAY: float = float(os.getenv("STUB_DELAY", "0"))
+
+    # Pipeline job state - "memory" (single instance) or "redis" (shared)
+    JOB_STORE_BACKEND: str = os.getenv("JOB_STORE_BACKEND", "memory")
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
     # Render - deployment (configured via render.yaml, not runtime)
 
     def validate(self) -> list[str]:
@@ -1,3 +1,3 @@
-from .orchestrator import BrandGuardPipeline
+from .orchestrator import BrandGuardPipeline, get_pipeline
 
-__all__ = ["BrandGuardPipeline"]
+__all__ = ["BrandGuardPipeline", "get_pipeline"]
@@ -0,0 +1,191 @@
+"""Storage backends for pipeline job state.
+
+Each pipeline run (process_mention, investigate, remediate) creates a job
+with an ordered set of named steps and updates them as it advances.
+Steps are held as a dict keyed by step name so an update is a single
+lookup; ``get`` renders them back as an ordered list for the API.
+
+Backends:
+  - InMemoryJobStore — default, single process
+  - RedisJobStore    — shared state for multi-instance deployments
+"""
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Any, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_JOB_TTL_SECONDS = 24 * 60 * 60
+
+
+class JobStore(ABC):
+    """Interface shared by all job state backends."""
+
+    @abstractmethod
+    async def create(self, job_id: str, skeleton: dict[str, Any]) -> None:
+        """Register a new job. ``skeleton["steps"]`` maps step name -> step dict, in order."""
+
+    @abstractmethod
+    async def update_step(
+        self, job_id: str, step: str, status: str, result: Any = None
+    ) -> None:
+        """Set a step's status (and result, when given)."""
+
+    @abstractmethod
+    async def finalize(self, job_id: str, status: str, **fields: Any) -> None:
+        """Set the job's final status plus any extra top-level fields."""
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[dict[str, Any]]:
+        """Return the job with its steps as an ordered list, or None."""
+
+
+class InMemoryJobStore(JobStore):
+    """Process-local job store guarded by a lock per job."""
+
+    def __init__(self):
+        self._jobs: dict[str, dict[str, Any]] = {}
+        self._locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def create(self, job_id: str, skeleton: dict[str, Any]) -> None:
+        job = dict(skeleton)
+        job["steps"] = {
+            name: {"name": name, **step} for name, step in skeleton.get("steps", {}).items()
+        }
+        async with self._locks[job_id]:
+            self._jobs[job_id] = job
+
+    async def update_step(
+        self, job_id: str, step: str, status: str, result: Any = None
+    ) -> None:
+        async with self._locks[job_id]:
+            job = self._jobs.get(job_id)
+            if job is None or step not in job["steps"]:
+                return
+            entry = job["steps"][step]
+            entry["status"] = status
+            if result is not None:
+                entry["result"] = result
+
+    async def finalize(self, job_id: str, status: str, **fields: Any) -> None:
+        async with self._locks[job_id]:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job["status"] = status
+                job.update(fields)
+        self._locks.pop(job_id, None)
+
+    async def get(self, job_id: str) -> Optional[dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        return {**job, "steps": list(job["steps"].values())}
+
+
+class RedisJobStore(JobStore):
+    """Job store backed by Redis hashes so several API instances share state.
+
+    Layout:
+      job:{id}          — top-level fields, JSON-encoded
+      job:{id}:steps    — one field per step name, JSON-encoded step dict
+      job:{id}:results  — one field per step name, JSON-encoded step result
+
+    Results live apart from the step dicts so a step update is a single
+    HSET per field, with no read-modify-write to race with other updates.
+    """
+
+    def __init__(self, url: str | None = None):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url or settings.REDIS_URL, decode_responses=True)
+
+    @staticmethod
+    def _keys(job_id: str) -> tuple[str, str, str]:
+        return f"job:{job_id}", f"job:{job_id}:steps", f"job:{job_id}:results"
+
+    async def create(self, job_id: str, skeleton: dict[str, Any]) -> None:
+        job_key, steps_key, _ = self._keys(job_id)
+        steps = skeleton.get("steps", {})
+        fields = {k: json.dumps(v) for k, v in skeleton.items() if k != "steps"}
+        fields["step_order"] = json.dumps(list(steps))
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(job_key, mapping=fields)
+            if steps:
+                pipe.hset(
+                    steps_key,
+                    mapping={name: json.dumps({"name": name, **step}) for name, step in steps.items()},
+                )
+            pipe.expire(job_key, _JOB_TTL_SECONDS)
+            pipe.expire(steps_key, _JOB_TTL_SECONDS)
+            await pipe.execute()
+
+    async def update_step(
+        self, job_id: str, step: str, status: str, result: Any = None
+    ) -> None:
+        job_key, steps_key, results_key = self._keys(job_id)
+        # Unknown job (expired or never created) or step: nothing to update,
+        # and writing would leave keys behind with no TTL
+        if not await self._redis.hexists(steps_key, step):
+            return
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(steps_key, step, json.dumps({"name": step, "status": status}))
+            if result is not None:
+                pipe.hset(results_key, step, json.dumps(result))
+            for key in (job_key, steps_key, results_key):
+                pipe.expire(key, _JOB_TTL_SECONDS)
+            await pipe.execute()
+
+    async def finalize(self, job_id: str, status: str, **fields: Any) -> None:
+        job_key, _, _ = self._keys(job_id)
+        if not await self._redis.exists(job_key):
+            return
+        mapping = {k: json.dumps(v) for k, v in fields.items()}
+        mapping["status"] = json.dumps(status)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(job_key, mapping=mapping)
+            pipe.expire(job_key, _JOB_TTL_SECONDS)
+            await pipe.execute()
+
+    async def get(self, job_id: str) -> Optional[dict[str, Any]]:
+        job_key, steps_key, results_key = self._keys(job_id)
+        raw_job = await self._redis.hgetall(job_key)
+        if not raw_job:
+            return None
+        raw_steps = await self._redis.hgetall(steps_key)
+        raw_results = await self._redis.hgetall(results_key)
+        order = json.loads(raw_job.pop("step_order", "[]"))
+        job = {k: json.loads(v) for k, v in raw_job.items()}
+        steps = []
+        for name in order:
+            if name not in raw_steps:
+                continue
+            entry = json.loads(raw_steps[name])
+            if name in raw_results:
+                entry["result"] = json.loads(raw_results[name])
+            steps.append(entry)
+        job["steps"] = steps
+        return job
+
+
+# ── Singleton accessor ──────────────────────────────────────────
+
+_store: Optional[JobStore] = None
+
+
+def get_job_store() -> JobStore:
+    """Return the configured job store (JOB_STORE_BACKEND = memory | redis)."""
+    global _store
+    if _store is None:
+        backend = settings.JOB_STORE_BACKEND.lower()
+        if backend == "redis":
+            _store = RedisJobStore()
+        else:
+            if backend != "memory":
+                logger.warning("Unknown JOB_STORE_BACKEND %r, using memory", backend)
+            _store = InMemoryJobStore()
+    return _store
@@ -8,48 +8,135 @@ The orchestrator is the central brain of BrandGuard. It:
 4. Aggregates results into actionable intelligence
 """
 import logging
+import re
+import time
 import uuid
 import asyncio
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime, timezone
-from typing import Any, Optional, Dict
+from typing import Any, Optional
 
 from app.config import settings
 from app.services.senso import SensoGEOClient, SensoSDKClient
 from app.services.tavily import TavilyClient
-from app.services.neo4j import Neo4jClient
+from app.services.neo4j import Neo4jClient, MentionBatcher
 from app.services.yutori import YutoriClient
 from app.services.modulate import ModulateService
+from app.services.providers import (
+    get_modulate,
+    get_neo4j,
+    get_senso_geo,
+    get_senso_sdk,
+    get_tavily,
+    get_yutori,
+)
+from app.services.agent.job_store import get_job_store
+from app.services.cache import AsyncTTLCache
+from app.services.severity import severity_for_score
 
 logger = logging.getLogger(__name__)
 
+# Chat keyword routing: the message is split into lowercase words once and
+# each route is a set-membership test; the first route that hits wins.
+# Whole-word matching, so "scanner" no longer triggers a full scan.
+_WORD = re.compile(r"[a-z]+")
+_ROUTES: tuple[tuple[str, frozenset[str]], ...] = (
+    ("search", frozenset({"search", "find", "web"})),
+    ("health", frozenset({"health", "score", "scores", "accuracy", "overview"})),
+    ("threat", frozenset({"threat", "threats", "source", "sources", "misinfo", "misinformation"})),
+    ("evaluate", frozenset({"evaluate", "check", "verify"})),
+    ("scan", frozenset({"scan"})),
+)
+
+# process_mention grades Senso's 0-1 accuracy more strictly: below 60% is
+# critical, so its 0.5 fallback (Senso unreachable) still queues remediation
+_MENTION_SEV_THRESHOLDS_PCT = (60, 80, 90)
+
+# Short-lived brand-health cache for chat; a per-brand lock makes concurrent
+# turns for the same brand share one Neo4j read. Each entry is [lock, users]
+# and is dropped once its last user leaves, so brand names sent by clients
+# can't grow the dict past the number of in-flight chat turns.
+_health_cache = AsyncTTLCache(maxsize=256, ttl=settings.CHAT_HEALTH_CACHE_TTL)
+_health_locks: dict[str, list] = {}
+
 # In-memory task store for tracking async agent tasks
 _task_store: dict[str, dict[str, Any]] = {}
+# status -> task ids (a dict, so insertion-ordered), kept in step with
+# _task_store by store_task; _task_status is the status each id is indexed
+# under, since callers may mutate the stored dict in place before re-storing
+_status_index: defaultdict[str, dict[str, None]] = defaultdict(dict)
+_task_status: dict[str, Any] = {}
+
+
+@contextmanager
+def _timed(step: str):
+    """Log wall-clock time spent in one external call at DEBUG level."""
+    t0 = time.monotonic_ns()
+    try:
+        yield
+    finally:
+        logger.debug("step=%s elapsed_ms=%d", step, (time.monotonic_ns() - t0) // 1_000_000)
+
+
+def _utcnow_iso() -> str:
+    """Timezone-aware UTC timestamp for job and mention records."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _pending_steps(names: tuple[str, ...]) -> dict[str, dict[str, Any]]:
+    """Fresh step-state dict for a new job, every step pending."""
+    return {name: {"status": "pending"} for name in names}
+
 
-# Global in-memory job store for hackathon purposes
-pipeline_jobs: Dict[str, Dict[str, Any]] = {}
+async def _timed_call(step: str, coro):
+    """Await ``coro`` under ``_timed`` so it can be scheduled as a task."""
+    with _timed(step):
+        return await coro
+
+
+async def _simulate_work() -> None:
+    """Stand-in for pipeline steps that aren't wired to a service yet.
+
+    No-op unless DEV_SIMULATE_WORK is set (useful for demoing the job UI).
+    """
+    if settings.DEV_SIMULATE_WORK:
+        await asyncio.sleep(settings.STUB_DELAY)
 
 
 class BrandGuardPipeline:
     """Autonomous agent pipeline that orchestrates all brand monitoring services."""
 
-    def __init__(self):
-        self.geo_client = SensoGEOClient()
-        self.sdk_client = SensoSDKClient()
-        self.tavily = TavilyClient()
-        self.neo4j = Neo4jClient()
-        self.yutori = YutoriClient()
-
-    def _update_job_step(self, job_id: str, step_name: str, status: str, result: Any = None):
+    # Ordered step names for each job type
+    _PROCESS_MENTION_STEPS = ("senso_evaluate", "tavily_search", "score_severity", "neo4j_store")
+    _INVESTIGATE_STEPS = ("tavily_extract", "yutori_research", "neo4j_update")
+    _REMEDIATE_STEPS = (
+        "senso_evaluate_detail",
+        "senso_remediate_strategy",
+        "senso_generate_content",
+        "neo4j_store_correction",
+    )
+
+    def __init__(
+        self,
+        *,
+        geo_client: Optional[SensoGEOClient] = None,
+        sdk_client: Optional[SensoSDKClient] = None,
+        tavily: Optional[TavilyClient] = None,
+        neo4j: Optional[Neo4jClient] = None,
+        yutori: Optional[YutoriClient] = None,
+    ):
+        self.geo_client = geo_client or get_senso_geo()
+        self.sdk_client = sdk_client or get_senso_sdk()
+        self.tavily = tavily or get_tavily()
+        self.neo4j = neo4j or get_neo4j()
+        self.yutori = yutori or get_yutori()
+        self.jobs = get_job_store()
+
+    async def _update_job_step(self, job_id: str, step_name: str, status: str, result: Any = None):
         """Update the status of a specific step in a job."""
-        if job_id not in pipeline_jobs:
-            return
-
-        for step in pipeline_jobs[job_id]["steps"]:
-            if step["name"] == step_name:
-                step["status"] = status
-                if result is not None:
-                    step["result"] = result
-                break
+        await self.jobs.update_step(job_id, step_name, status, result)
 
     async def process_mention(self, mention_data: dict, job_id: str) -> dict:
         """Full monitoring pipeline for a single mention.
@@ -61,62 +148,63 @@ class BrandGuardPipeline:
         5. Create alert if needed
         """
         try:
-            pipeline_jobs[job_id] = {
+            await self.jobs.create(job_id, {
                 "status": "running",
-                "start_time": datetime.now().isoformat(),
-                "steps": [
-                    {"name": "senso_evaluate", "status": "pending"},
-                    {"name": "tavily_search", "status": "pending"},
-                    {"name": "score_severity", "status": "pending"},
-                    {"name": "neo4j_store", "status": "pending"}
-                ],
+                "start_time": _utcnow_iso(),
+                "steps": _pending_steps(self._PROCESS_MENTION_STEPS),
                 "result": None
-            }
+            })
 
             brand_id = mention_data.get("brand_id", "unknown_brand")
             content = mention_data.get("content", "")
 
-            # Step 1: Senso evaluate
-            self._update_job_step(job_id, "senso_evaluate", "running")
-            try:
-                eval_res = await self.geo_client.evaluate(query=content, brand=brand_id, network="web")
-            except Exception as e:
-                logger.error(f"Senso evaluate failed: {e}")
+            # Steps 1 + 2: Senso evaluate and Tavily search only depend on
+            # ``content``, so run them concurrently.
+            await self._update_job_step(job_id, "senso_evaluate", "running")
+            await self._update_job_step(job_id, "tavily_search", "running")
+            eval_task = asyncio.create_task(
+                _timed_call(
+                    "senso_evaluate",
+                    self.geo_client.evaluate(query=content, brand=brand_id, network="web"),
+                )
+            )
+            search_task = asyncio.create_task(
+                _timed_call(
+                    "tavily_search",
+                    self.tavily.search(query=content, search_depth="basic", max_results=3),
+                )
+            )
+            eval_res, search_res = await asyncio.gather(
+                eval_task, search_task, return_exceptions=True
+            )
+
+            if isinstance(eval_res, Exception):
+                logger.error(f"Senso evaluate failed: {eval_res}")
                 eval_res = {"accuracy": 0.5, "citations": [], "missing": []}
-            self._update_job_step(job_id, "senso_evaluate", "completed", eval_res)
+            await self._update_job_step(job_id, "senso_evaluate", "completed", eval_res)
 
-            # Step 2: Tavily search
-            self._update_job_step(job_id, "tavily_search", "running")
-            try:
-                search_res = await self.tavily.search(query=content, search_depth="basic", max_results=3)
-            except Exception as e:
-                logger.error(f"Tavily search failed: {e}")
+            if isinstance(search_res, Exception):
+                logger.error(f"Tavily search failed: {search_res}")
                 search_res = {"results": [{"title": "Mock Source", "url": "https://example.com"}]}
-            self._update_job_step(job_id, "tavily_search", "completed", search_res)
+            await self._update_job_step(job_id, "tavily_search", "completed", search_res)
 
             # Step 3: Score severity
-            self._update_job_step(job_id, "score_severity", "running")
+            await self._update_job_step(job_id, "score_severity", "running")
             accuracy = eval_res.get("accuracy", 1.0)
-            severity = "LOW"
-            if accuracy < 0.6:
-                severity = "CRITICAL"
-            elif accuracy < 0.8:
-                severity = "HIGH"
-            elif accuracy < 0.9:
-                severity = "MEDIUM"
+            severity = severity_for_score(accuracy * 100, _MENTION_SEV_THRESHOLDS_PCT).upper()
 
             score_res = {"accuracy": accuracy, "severity": severity}
-            self._update_job_step(job_id, "score_severity", "completed", score_res)
+            await self._update_job_step(job_id, "score_severity", "completed", score_res)
 
             # Step 4: Store in Neo4j
-            self._update_job_step(job_id, "neo4j_store", "running")
+            await self._update_job_step(job_id, "neo4j_store", "running")
             try:
                 pass
             except Exception as e:
                 logger.error(f"Neo4j store failed: {e}")
 
             neo4j_res = {"status": "stored", "entity_id": mention_data.get("id", "mock_id")}
-            self._update_job_step(job_id, "neo4j_store", "completed", neo4j_res)
+            await self._update_job_step(job_id, "neo4j_store", "completed", neo4j_res)
 
             # Finalize job
             final_result = {
@@ -127,17 +215,15 @@ class BrandGuardPipeline:
                 "auto_remediate_queued": severity == "CRITICAL"
             }
 
-            pipeline_jobs[job_id]["status"] = "completed"
-            pipeline_jobs[job_id]["result"] = final_result
-            pipeline_jobs[job_id]["end_time"] = datetime.now().isoformat()
+            await self.jobs.finalize(
+                job_id, "completed", result=final_result, end_time=_utcnow_iso()
+            )
 
             return final_result
 
         except Exception as e:
             logger.error(f"Pipeline error for job {job_id}: {e}")
-            if job_id in pipeline_jobs:
-                pipeline_jobs[job_id]["status"] = "failed"
-                pipeline_jobs[job_id]["error"] = str(e)
+            await self.jobs.finalize(job_id, "failed", error=str(e))
             raise
 
     async def investigate(self, mention_id: str, job_id: str) -> dict:
@@ -149,31 +235,30 @@ class BrandGuardPipeline:
         4. Update Neo4j graph
         """
         try:
-            pipeline_jobs[job_id] = {
+            await self.jobs.create(job_id, {
                 "status": "running",
-                "start_time": datetime.now().isoformat(),
-                "steps": [
-                    {"name": "tavily_extract", "status": "pending"},
-                    {"name": "yutori_research", "status": "pending"},
-                    {"name": "neo4j_update", "status": "pending"}
-                ],
+                "start_time": _utcnow_iso(),
+                "steps": _pending_steps(self._INVESTIGATE_STEPS),
                 "result": None
-            }
+            })
 
-            # Step 1: Tavily extract
-            self._update_job_step(job_id, "tavily_extract", "running")
-            await asyncio.sleep(1)  # Simulate work
-            self._update_job_step(job_id, "tavily_extract", "completed", {"sources_extracted": 2})
+            # Steps 1+2: Tavily extract and Yutori research are independent
+            async def _extract() -> None:
+                await self._update_job_step(job_id, "tavily_extract", "running")
+                await _simulate_work()
+                await self._update_job_step(job_id, "tavily_extract", "completed", {"sources_extracted": 2})
 
-            # Step 2: Yutori research
-            self._update_job_step(job_id, "yutori_research", "running")
-            await asyncio.sleep(1)  # Simulate work
-            self._update_job_step(job_id, "yutori_research", "completed", {"insights": ["Insight 1", "Insight 2"]})
+            async def _research() -> None:
+                await self._update_job_step(job_id, "yutori_research", "running")
+                await _simulate_work()
+                await self._update_job_step(job_id, "yutori_research", "completed", {"insights": ["Insight 1", "Insight 2"]})
+
+            await asyncio.gather(_extract(), _research())
 
             # Step 3: Update Neo4j
-            self._update_job_step(job_id, "neo4j_update", "running")
-            await asyncio.sleep(1)  # Simulate work
-            self._update_job_step(job_id, "neo4j_update", "completed", {"nodes_added": 3, "edges_added": 4})
+            await self._update_job_step(job_id, "neo4j_update", "running")
+            await _simulate_work()
+            await self._update_job_step(job_id, "neo4j_update", "completed", {"nodes_added": 3, "edges_added": 4})
 
             final_result = {
                 "mention_id": mention_id,
@@ -182,17 +267,15 @@ class BrandGuardPipeline:
                 "insights_generated": 2
             }
 
-            pipeline_jobs[job_id]["status"] = "completed"
-            pipeline_jobs[job_id]["result"] = final_result
-            pipeline_jobs[job_id]["end_time"] = datetime.now().isoformat()
+            await self.jobs.finalize(
+                job_id, "completed", result=final_result, end_time=_utcnow_iso()
+            )
 
             return final_result
 
         except Exception as e:
             logger.error(f"Investigation error for job {job_id}: {e}")
-            if job_id in pipeline_jobs:
-                pipeline_jobs[job_id]["status"] = "failed"
-                pipeline_jobs[job_id]["error"] = str(e)
+            await self.jobs.finalize(job_id, "failed", error=str(e))
             raise
 
     async def remediate(self, mention_id: str, brand_id: str, job_id: str) -> dict:
@@ -204,51 +287,49 @@ class BrandGuardPipeline:
         4. Store correction in Neo4j
         """
         try:
-            pipeline_jobs[job_id] = {
+            await self.jobs.create(job_id, {
                 "status": "running",
-                "start_time": datetime.now().isoformat(),
-                "steps": [
-                    {"name": "senso_evaluate_detail", "status": "pending"},
-                    {"name": "senso_remediate_strategy", "status": "pending"},
-                    {"name": "senso_generate_content", "status": "pending"},
-                    {"name": "neo4j_store_correction", "status": "pending"}
-                ],
+                "start_time": _utcnow_iso(),
+                "steps": _pending_steps(self._REMEDIATE_STEPS),
                 "result": None
-            }
+            })
 
             # Step 1: Senso evaluate
-            self._update_job_step(job_id, "senso_evaluate_detail", "running")
+            await self._update_job_step(job_id, "senso_evaluate_detail", "running")
             try:
-                eval_res = await self.geo_client.evaluate(query=f"Mention {mention_id}", brand=brand_id, network="web")
+                with _timed("senso_evaluate_detail"):
+                    eval_res = await self.geo_client.evaluate(query=f"Mention {mention_id}", brand=brand_id, network="web")
             except Exception:
                 eval_res = {"accuracy": 0.5, "missing": ["Fact A"]}
-            self._update_job_step(job_id, "senso_evaluate_detail", "completed", eval_res)
+            await self._update_job_step(job_id, "senso_evaluate_detail", "completed", eval_res)
 
             # Step 2: Senso remediate
-            self._update_job_step(job_id, "senso_remediate_strategy", "running")
+            await self._update_job_step(job_id, "senso_remediate_strategy", "running")
             try:
-                rem_res = await self.geo_client.remediate(
-                    context=f"Mention {mention_id}",
-                    optimize_for="brand_safety",
-                    target_networks=["web"]
-                )
+                with _timed("senso_remediate"):
+                    rem_res = await self.geo_client.remediate(
+                        context=f"Mention {mention_id}",
+                        optimize_for="brand_safety",
+                        target_networks=["web"]
+                    )
             except Exception:
                 rem_res = {"strategy": "Acknowledge and correct"}
-            self._update_job_step(job_id, "senso_remediate_strategy", "completed", rem_res)
+            await self._update_job_step(job_id, "senso_remediate_strategy", "completed", rem_res)
 
             # Step 3: Senso generate
-            self._update_job_step(job_id, "senso_generate_content", "running")
+            await self._update_job_step(job_id, "senso_generate_content", "running")
             try:
                 prompt = f"Write a professional correction for mention {mention_id} regarding brand {brand_id}."
-                gen_res = await self.sdk_client.generate(prompt=prompt)
+                with _timed("senso_generate"):
+                    gen_res = await self.sdk_client.generate(prompt=prompt)
             except Exception:
                 gen_res = {"generated_text": "We are aware of the statements and want to clarify our position based on our official guidelines."}
-            self._update_job_step(job_id, "senso_generate_content", "completed", gen_res)
+            await self._update_job_step(job_id, "senso_generate_content", "completed", gen_res)
 
             # Step 4: Neo4j store
-            self._update_job_step(job_id, "neo4j_store_correction", "running")
-            await asyncio.sleep(0.5)
-            self._update_job_step(job_id, "neo4j_store_correction", "completed", {"status": "stored"})
+            await self._update_job_step(job_id, "neo4j_store_correction", "running")
+            await _simulate_work()
+            await self._update_job_step(job_id, "neo4j_store_correction", "completed", {"status": "stored"})
 
             final_result = {
                 "mention_id": mention_id,
@@ -257,17 +338,15 @@ class BrandGuardPipeline:
                 "status": "ready_for_review"
             }
 
-            pipeline_jobs[job_id]["status"] = "completed"
-            pipeline_jobs[job_id]["result"] = final_result
-            pipeline_jobs[job_id]["end_time"] = datetime.now().isoformat()
+            await self.jobs.finalize(
+                job_id, "completed", result=final_result, end_time=_utcnow_iso()
+            )
 
             return final_result
 
         except Exception as e:
             logger.error(f"Remediation error for job {job_id}: {e}")
-            if job_id in pipeline_jobs:
-                pipeline_jobs[job_id]["status"] = "failed"
-                pipeline_jobs[job_id]["error"] = str(e)
+            await self.jobs.finalize(job_id, "failed", error=str(e))
             raise
 
 
@@ -275,13 +354,22 @@ class AgentOrchestrator:
     """High-level orchestrator providing chat, full scan, threat assessment,
     and compliance check capabilities."""
 
-    def __init__(self):
-        self.senso_geo = SensoGEOClient()
-        self.senso_sdk = SensoSDKClient()
-        self.tavily = TavilyClient()
-        self.neo4j = Neo4jClient()
-        self.yutori = YutoriClient()
-        self.modulate = ModulateService()
+    def __init__(
+        self,
+        *,
+        senso_geo: Optional[SensoGEOClient] = None,
+        senso_sdk: Optional[SensoSDKClient] = None,
+        tavily: Optional[TavilyClient] = None,
+        neo4j: Optional[Neo4jClient] = None,
+        yutori: Optional[YutoriClient] = None,
+        modulate: Optional[ModulateService] = None,
+    ):
+        self.senso_geo = senso_geo or get_senso_geo()
+        self.senso_sdk = senso_sdk or get_senso_sdk()
+        self.tavily = tavily or get_tavily()
+        self.neo4j = neo4j or get_neo4j()
+        self.yutori = yutori or get_yutori()
+        self.modulate = modulate or get_modulate()
         self.model = settings.OPENAI_MODEL
 
     async def chat(self, message: str, brand_id: Optional[str] = None, session_id: Optional[str] = None) -> dict[str, Any]:
@@ -296,82 +384,22 @@ class AgentOrchestrator:
         - Default -> Brand health summary
         """
         brand = brand_id or "default"
-        msg_lower = message.lower()
-        actions_taken = []
 
         try:
-            if any(kw in msg_lower for kw in ["search", "find", "web"]):
-                result = await self.tavily.search(
-                    query=f"{brand} {message}",
-                    max_results=5,
-                    include_answer=True,
-                )
-                actions_taken.append("tavily_search")
-                return {
-                    "response": result.get("answer", "No answer synthesized."),
-                    "sources": [
-                        {"url": r.get("url"), "title": r.get("title")}
-                        for r in result.get("results", [])[:5]
-                    ],
-                    "actions": actions_taken,
-                }
-
-            if any(kw in msg_lower for kw in ["health", "score", "accuracy", "overview"]):
-                health = await self.neo4j.get_brand_health(brand)
-                actions_taken.append("neo4j_brand_health")
-                return {
-                    "response": (
-                        f"Brand health for '{brand}': "
-                        f"Overall accuracy {health['overall_accuracy']}%, "
-                        f"{health['total_mentions']} total mentions, "
-                        f"{health['threats']} threats detected."
-                    ),
-                    "data": health,
-                    "actions": actions_taken,
-                }
-
-            if any(kw in msg_lower for kw in ["threat", "source", "misinfo"]):
-                sources = await self.neo4j.get_brand_sources(brand, limit=10)
-                actions_taken.append("neo4j_brand_sources")
-                return {
-                    "response": f"Found {len(sources)} misinformation sources for '{brand}'.",
-                    "sources": sources,
-                    "actions": actions_taken,
-                }
-
-            if any(kw in msg_lower for kw in ["evaluate", "check", "verify"]):
-                try:
-                    eval_result = await self.senso_geo.evaluate(
-                        query=message, brand=brand, network="all"
-                    )
-                    actions_taken.append("senso_evaluate")
-                    return {
-                        "response": "Content evaluated with Senso GEO.",
-                        "evaluation": eval_result,
-                        "actions": actions_taken,
-                    }
-                except Exception as exc:
-                    logger.warning("Senso evaluate failed: %s", exc)
-                    return {
-                        "response": f"Evaluation attempted but Senso returned an error: {exc}",
-                        "actions": ["senso_evaluate_failed"],
-                    }
-
-            if "scan" in msg_lower:
-                return await self.run_full_scan(brand)
-
-            # Default: return brand health summary
-            health = await self.neo4j.get_brand_health(brand)
-            actions_taken.append("neo4j_brand_health")
-            return {
-                "response": (
-                    f"Brand '{brand}' has an accuracy score of {health['overall_accuracy']}% "
-                    f"across {health['total_mentions']} mentions. "
-                    f"Ask me to search the web, check threats, evaluate content, or run a full scan."
-                ),
-                "data": health,
-                "actions": actions_taken,
+            words = set(_WORD.findall(message.lower()))
+            route = next(
+                (name for name, keywords in _ROUTES if not words.isdisjoint(keywords)),
+                "default",
+            )
+            handlers = {
+                "search": self._chat_search,
+                "health": self._chat_health,
+                "threat": self._chat_threats,
+                "evaluate": self._chat_evaluate,
+                "scan": self._chat_scan,
+                "default": self._chat_default,
             }
+            return await handlers[route](message, brand)
         except Exception as exc:
             logger.error("Agent chat error: %s", exc)
             return {
@@ -380,67 +408,135 @@ class AgentOrchestrator:
                 "error": str(exc),
             }
 
+    async def _cached_health(self, brand: str) -> dict[str, Any]:
+        """Brand health for chat, reused for CHAT_HEALTH_CACHE_TTL seconds."""
+        entry = _health_locks.setdefault(brand, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                health = await _health_cache.get(brand)
+                if health is None:
+                    with _timed("neo4j_brand_health"):
+                        health = await self.neo4j.get_brand_health(brand)
+                    await _health_cache.set(brand, health)
+                return health
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del _health_locks[brand]
+
+    # ── Chat route handlers ─────────────────────────────────────
+
+    async def _chat_search(self, message: str, brand: str) -> dict[str, Any]:
+        with _timed("tavily_search"):
+            result = await self.tavily.search(
+                query=f"{brand} {message}",
+                max_results=5,
+                include_answer=True,
+            )
+        return {
+            "response": result.get("answer", "No answer synthesized."),
+            "sources": [
+                {"url": r.get("url"), "title": r.get("title")}
+                for r in result.get("results", [])[:5]
+            ],
+            "actions": ["tavily_search"],
+        }
+
+    async def _chat_health(self, message: str, brand: str) -> dict[str, Any]:
+        health = await self._cached_health(brand)
+        return {
+            "response": (
+                f"Brand health for '{brand}': "
+                f"Overall accuracy {health['overall_accuracy']}%, "
+                f"{health['total_mentions']} total mentions, "
+                f"{health['threats']} threats detected."
+            ),
+            "data": health,
+            "actions": ["neo4j_brand_health"],
+        }
+
+    async def _chat_threats(self, message: str, brand: str) -> dict[str, Any]:
+        with _timed("neo4j_brand_sources"):
+            sources = await self.neo4j.get_brand_sources(brand, limit=10)
+        return {
+            "response": f"Found {len(sources)} misinformation sources for '{brand}'.",
+            "sources": sources,
+            "actions": ["neo4j_brand_sources"],
+        }
+
+    async def _chat_evaluate(self, message: str, brand: str) -> dict[str, Any]:
+        try:
+            with _timed("senso_evaluate"):
+                eval_result = await self.senso_geo.evaluate(
+                    query=message, brand=brand, network="all"
+                )
+            return {
+                "response": "Content evaluated with Senso GEO.",
+                "evaluation": eval_result,
+                "actions": ["senso_evaluate"],
+            }
+        except Exception as exc:
+            logger.warning("Senso evaluate failed: %s", exc)
+            return {
+                "response": f"Evaluation attempted but Senso returned an error: {exc}",
+                "actions": ["senso_evaluate_failed"],
+            }
+
+    async def _chat_scan(self, message: str, brand: str) -> dict[str, Any]:
+        return await self.run_full_scan(brand)
+
+    async def _chat_default(self, message: str, brand: str) -> dict[str, Any]:
+        health = await self._cached_health(brand)
+        return {
+            "response": (
+                f"Brand '{brand}' has an accuracy score of {health['overall_accuracy']}% "
+                f"across {health['total_mentions']} mentions. "
+                f"Ask me to search the web, check threats, evaluate content, or run a full scan."
+            ),
+            "data": health,
+            "actions": ["neo4j_brand_health"],
+        }
+
     async def run_full_scan(self, brand_id: str) -> dict[str, Any]:
         """Run a comprehensive brand scan.
 
         Pipeline: Tavily search -> Senso evaluation -> Neo4j storage -> report
+
+        The whole scan runs under a SCAN_TIMEOUT_S deadline; on timeout the
+        outstanding subtasks are cancelled and partial results are returned
+        with status "timed_out".
         """
         task_id = str(uuid.uuid4())
         steps_completed = []
-        mentions_stored = 0
         errors = []
+        status = "completed"
+        web_results_found = 0
+        candidates: list[dict[str, str]] = []
+        evaluated: list[dict[str, Any]] = []
+        mentions_stored = 0
+        health: dict[str, Any] = {}
+        scanned_at = _utcnow_iso()
 
-        # Step 1: Search the web for brand mentions
-        try:
-            search_result = await self.tavily.search(
-                query=f"{brand_id} brand reputation claims",
-                topic="news",
-                search_depth="advanced",
-                max_results=10,
-                include_answer=True,
-            )
-            steps_completed.append("web_search")
-            web_results = search_result.get("results", [])
-        except Exception as exc:
-            logger.warning("Full scan: Tavily search failed: %s", exc)
-            errors.append(f"web_search: {exc}")
-            web_results = []
-
-        # Step 2: Evaluate each result with Senso GEO
-        evaluated = []
-        for result in web_results[:10]:
-            claim = result.get("content", result.get("title", ""))[:300]
-            try:
-                eval_result = await self.senso_geo.evaluate(
-                    query=claim, brand=brand_id, network="all"
-                )
-                accuracy = eval_result.get("accuracy_score", eval_result.get("score", 50))
-                evaluated.append({
-                    "claim": claim,
-                    "url": result.get("url", ""),
-                    "accuracy_score": float(accuracy),
-                    "evaluation": eval_result,
-                })
-            except Exception:
-                evaluated.append({
-                    "claim": claim,
-                    "url": result.get("url", ""),
-                    "accuracy_score": 50.0,
-                    "evaluation": {"fallback": True},
-                })
-        if evaluated:
-            steps_completed.append("senso_evaluation")
-
-        # Step 3: Store mentions in Neo4j
-        for item in evaluated:
-            severity = "low"
+        eval_sem = asyncio.Semaphore(settings.SENSO_MAX_CONCURRENCY)
+
+        async def _evaluate(candidate: dict[str, str]) -> dict[str, Any]:
+            claim = candidate["claim"]
+            async with eval_sem:
+                try:
+                    with _timed("senso_evaluate"):
+                        eval_result = await self.senso_geo.evaluate(
+                            query=claim, brand=brand_id, network="all"
+                        )
+                    accuracy = eval_result.get("accuracy_score", eval_result.get("score", 50))
+                    return {**candidate, "accuracy_score": float(accuracy)}
+                except Exception:
+                    return {**candidate, "accuracy_score": 50.0}
+
+        async def _store(batcher: MentionBatcher, item: dict[str, Any]) -> None:
+            nonlocal mentions_stored
             score = item["accuracy_score"]
-            if score < 40:
-                severity = "critical"
-            elif score < 60:
-                severity = "high"
-            elif score < 80:
-                severity = "medium"
+            severity = severity_for_score(score)
 
             mention = {
                 "brand_id": brand_id,
@@ -449,32 +545,85 @@ class AgentOrchestrator:
                 "claim": item["claim"],
                 "accuracy_score": score,
                 "severity": severity,
-                "detected_at": datetime.now(timezone.utc).isoformat(),
+                "detected_at": scanned_at,
                 "source_urls": [item["url"]] if item.get("url") else [],
             }
             try:
-                await self.neo4j.store_mention(mention)
+                await batcher.process(mention)
+                # Counted as each write lands so a timed-out scan still reports it
                 mentions_stored += 1
             except Exception as exc:
                 errors.append(f"neo4j_store: {exc}")
-        if mentions_stored > 0:
-            steps_completed.append("neo4j_storage")
 
-        # Step 4: Get updated brand health
         try:
-            health = await self.neo4j.get_brand_health(brand_id)
-            steps_completed.append("health_report")
-        except Exception:
-            health = {}
+            async with asyncio.timeout(settings.SCAN_TIMEOUT_S):
+                # Step 1: Search the web for brand mentions
+                try:
+                    with _timed("tavily_search"):
+                        search_result = await self.tavily.search(
+                            query=f"{brand_id} brand reputation claims",
+                            topic="news",
+                            search_depth="advanced",
+                            max_results=10,
+                            include_answer=True,
+                        )
+                    steps_completed.append("web_search")
+                    # Keep only the trimmed claim + URL; Tavily's full page
+                    # content isn't needed past this point.
+                    raw_results = search_result.get("results", [])
+                    web_results_found = len(raw_results)
+                    candidates = [
+                        {
+                            "url": r.get("url", ""),
+                            "claim": (r.get("content") or r.get("title") or "")[:300],
+                        }
+                        for r in raw_results[:10]
+                    ]
+                    del search_result, raw_results
+                except Exception as exc:
+                    logger.warning("Full scan: Tavily search failed: %s", exc)
+                    errors.append(f"web_search: {exc}")
+
+                # Steps 2+3: Evaluate each result with Senso GEO (concurrently,
+                # bounded) and hand each one to the Neo4j batcher as soon as
+                # its evaluation lands, so writes overlap the remaining evals.
+                with _timed("evaluate_and_store"):
+                    async with MentionBatcher(self.neo4j) as batcher:
+                        async with asyncio.TaskGroup() as tg:
+                            eval_tasks = [tg.create_task(_evaluate(c)) for c in candidates]
+                            for next_eval in asyncio.as_completed(eval_tasks):
+                                item = await next_eval
+                                evaluated.append(item)
+                                tg.create_task(_store(batcher, item))
+                if evaluated:
+                    steps_completed.append("senso_evaluation")
+                if mentions_stored > 0:
+                    steps_completed.append("neo4j_storage")
+
+                # Step 4: Get updated brand health
+                try:
+                    with _timed("neo4j_brand_health"):
+                        health = await self.neo4j.get_brand_health(brand_id)
+                    steps_completed.append("health_report")
+                except Exception:
+                    health = {}
+        except TimeoutError:
+            logger.warning("Full scan for %s exceeded %ss", brand_id, settings.SCAN_TIMEOUT_S)
+            status = "timed_out"
+            errors.append(f"timeout: scan exceeded {settings.SCAN_TIMEOUT_S}s")
+        finally:
+            # Also after a timeout: batches flushed before it are already in Neo4j
+            if mentions_stored > 0:
+                await _health_cache.delete(brand_id)
 
         return {
             "task_id": task_id,
             "task_type": "full_scan",
             "brand_id": brand_id,
-            "status": "completed",
+            "status": status,
             "steps_completed": steps_completed,
             "results": {
-                "web_results_found": len(web_results),
+                "web_results_found": web_results_found,
                 "mentions_evaluated": len(evaluated),
                 "mentions_stored": mentions_stored,
                 "health": health,
@@ -491,25 +640,48 @@ class AgentOrchestrator:
         steps_completed = []
         errors = []
 
-        # Step 1: Get existing threats from Neo4j
-        try:
-            health = await self.neo4j.get_brand_health(brand_id)
-            sources = await self.neo4j.get_brand_sources(brand_id, limit=10)
-            steps_completed.append("neo4j_query")
-        except Exception as exc:
+        # Neo4j reads and the fresh Tavily search are independent — overlap them.
+        health_t = asyncio.create_task(
+            _timed_call("neo4j_brand_health", self.neo4j.get_brand_health(brand_id))
+        )
+        sources_t = asyncio.create_task(
+            _timed_call("neo4j_brand_sources", self.neo4j.get_brand_sources(brand_id, limit=10))
+        )
+        search_t = asyncio.create_task(
+            _timed_call(
+                "tavily_search",
+                self.tavily.search(
+                    query=f"{brand_id} misinformation controversy negative claims",
+                    topic="news",
+                    time_range="week",
+                    max_results=10,
+                    include_answer=True,
+                ),
+            )
+        )
+        health, sources, search = await asyncio.gather(
+            health_t, sources_t, search_t, return_exceptions=True
+        )
+
+        # Step 1: Existing threats from Neo4j
+        neo4j_ok = True
+        if isinstance(health, Exception):
+            errors.append(f"neo4j: {health}")
             health = {}
+            neo4j_ok = False
+        if isinstance(sources, Exception):
+            errors.append(f"neo4j: {sources}")
             sources = []
-            errors.append(f"neo4j: {exc}")
+            neo4j_ok = False
+        if neo4j_ok:
+            steps_completed.append("neo4j_query")
 
-        # Step 2: Search for recent threats
-        try:
-            search = await self.tavily.search(
-                query=f"{brand_id} misinformation controversy negative claims",
-                topic="news",
-                time_range="week",
-                max_results=10,
-                include_answer=True,
-            )
+        # Step 2: Recent threats from the web
+        if isinstance(search, Exception):
+            new_threats = []
+            summary = "Could not search for new threats."
+            errors.append(f"tavily: {search}")
+        else:
             steps_completed.append("tavily_search")
             new_threats = [
                 {
@@ -520,9 +692,8 @@ class AgentOrchestrator:
                 }
                 for r in search.get("results", [])
             ]
-        except Exception as exc:
-            new_threats = []
-            errors.append(f"tavily: {exc}")
+            summary = search.get("answer", "")
+        del search
 
         return {
             "task_id": task_id,
@@ -535,7 +706,7 @@ class AgentOrchestrator:
                 "total_threats": health.get("threats", 0),
                 "known_sources": sources,
                 "new_threats": new_threats,
-                "summary": search.get("answer", "") if "tavily_search" in steps_completed else "Could not search for new threats.",
+                "summary": summary,
             },
             "errors": errors,
         }
@@ -549,28 +720,32 @@ class AgentOrchestrator:
         steps_completed = []
         errors = []
 
-        # Evaluate with Senso GEO
-        try:
-            eval_result = await self.senso_geo.evaluate(
-                query=content, brand=brand_id, network="all"
-            )
+        # Evaluation and knowledge search only depend on ``content`` — run both at once.
+        eval_result, knowledge = await asyncio.gather(
+            _timed_call(
+                "senso_evaluate",
+                self.senso_geo.evaluate(query=content, brand=brand_id, network="all"),
+            ),
+            _timed_call("senso_sdk_search", self.senso_sdk.search(query=content)),
+            return_exceptions=True,
+        )
+
+        if isinstance(eval_result, Exception):
+            logger.warning("Compliance check: Senso failed: %s", eval_result)
+            errors.append(f"senso: {eval_result}")
+            eval_result = {"error": str(eval_result), "fallback": True}
+            accuracy = None
+            is_compliant = None
+        else:
             steps_completed.append("senso_evaluate")
             accuracy = eval_result.get("accuracy_score", eval_result.get("score", None))
             is_compliant = accuracy is not None and float(accuracy) >= 70
-        except Exception as exc:
-            logger.warning("Compliance check: Senso failed: %s", exc)
-            errors.append(f"senso: {exc}")
-            eval_result = {"error": str(exc), "fallback": True}
-            accuracy = None
-            is_compliant = None
 
-        # Try to search brand knowledge for context
-        try:
-            knowledge = await self.senso_sdk.search(query=content)
-            steps_completed.append("senso_sdk_search")
-        except Exception as exc:
+        if isinstance(knowledge, Exception):
+            errors.append(f"senso_sdk: {knowledge}")
             knowledge = {}
-            errors.append(f"senso_sdk: {exc}")
+        else:
+            steps_completed.append("senso_sdk_search")
 
         return {
             "task_id": task_id,
@@ -589,19 +764,43 @@ class AgentOrchestrator:
         }
 
 
+@lru_cache(maxsize=None)
+def get_pipeline() -> BrandGuardPipeline:
+    """Shared BrandGuardPipeline (it holds no per-request state)."""
+    return BrandGuardPipeline()
+
+
+@lru_cache(maxsize=None)
+def get_orchestrator() -> AgentOrchestrator:
+    """Shared AgentOrchestrator (it holds no per-request state)."""
+    return AgentOrchestrator()
+
+
 def get_task(task_id: str) -> Optional[dict[str, Any]]:
     """Retrieve a task from the in-memory store."""
     return _task_store.get(task_id)
 
 
 def store_task(task: dict[str, Any]) -> None:
-    """Save a task result to the in-memory store."""
-    _task_store[task.get("task_id", str(uuid.uuid4()))] = task
+    """Save a task result to the in-memory store.
+
+    Re-store a task after changing its status so the status index follows.
+    Synchronous on purpose: with no await between the store and index
+    updates, no other coroutine can observe them out of step.
+    """
+    task_id = task.get("task_id", str(uuid.uuid4()))
+    status = task.get("status")
+    if task_id in _task_status:
+        old_status = _task_status[task_id]
+        if old_status != status:
+            _status_index[old_status].pop(task_id, None)
+    _task_store[task_id] = task
+    _task_status[task_id] = status
+    _status_index[status][task_id] = None
 
 
 def list_tasks(status: Optional[str] = None) -> list[dict[str, Any]]:
     """List all stored tasks, optionally filtered by status."""
-    tasks = list(_task_store.values())
-    if status:
-        tasks = [t for t in tasks if t.get("status") == status]
-    return tasks
+    if not status:
+        return list(_task_store.values())
+    return [_task_store[tid] for tid in _status_index.get(status, ())]
@@ -0,0 +1,72 @@
+"""Small in-process caches shared by the service clients.
+
+``AsyncTTLCache`` is a size-bounded LRU whose entries also expire after a
+TTL. It is guarded by an ``asyncio.Lock`` so it can be shared freely
+between coroutines on the same event loop.
+"""
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+def make_key(*parts: Any) -> str:
+    """Hash key parts into a short fixed-size cache key.
+
+    Hashing keeps memory bounded when parts are long (e.g. a full claim text).
+    """
+    raw = "|".join(str(p) for p in parts).encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class AsyncTTLCache:
+    """LRU cache with per-entry expiry.
+
+    Args:
+        maxsize: Maximum number of live entries; the least recently used
+            entry is evicted first.
+        ttl: Default time-to-live in seconds. ``0`` disables caching.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        async with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if time.monotonic() > expires_at:
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        async with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        async with self._lock:
+            self._data.pop(key, None)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        """Drop every entry whose key starts with ``prefix``."""
+        async with self._lock:
+            for key in [k for k in self._data if k.startswith(prefix)]:
+                del self._data[key]
+
+    async def clear(self) -> None:
+        async with self._lock:
+            self._data.clear()
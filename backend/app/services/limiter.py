@@ -0,0 +1,181 @@
+"""Adaptive concurrency limiting for upstream API calls.
+
+``AdaptiveLimiter`` behaves like a semaphore whose size follows the
+upstream's capacity, AIMD-style: the limit is halved whenever a call comes
+back overloaded (HTTP 429/503 by default) and grows by one after a run of
+consecutive successes. An optional requests-per-minute cap is enforced
+with a sliding window on top of that. ``with_adaptive_retry`` wraps an
+async function so each attempt holds a limiter slot and overloaded
+attempts are retried with jittered exponential backoff, waiting at least
+as long as any ``Retry-After`` header asks. Callers can opt into also
+retrying transient failures (``is_http_transient``) that say nothing about
+upstream load and so leave the limit alone.
+"""
+import asyncio
+import functools
+import logging
+import random
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_OVERLOAD_STATUS = frozenset({429, 503})
+_TRANSIENT_STATUS = frozenset({500, 502, 504})
+_RATE_WINDOW = 60.0
+
+
+def is_http_overload(exc: BaseException) -> bool:
+    """True for httpx errors that mean "slow down" rather than "broken"."""
+    return (
+        isinstance(exc, httpx.HTTPStatusError)
+        and exc.response.status_code in _OVERLOAD_STATUS
+    )
+
+
+def is_http_transient(exc: BaseException) -> bool:
+    """True for dropped connections, read timeouts and 500/502/504 responses."""
+    if isinstance(exc, (httpx.ConnectError, httpx.ReadTimeout)):
+        return True
+    return (
+        isinstance(exc, httpx.HTTPStatusError)
+        and exc.response.status_code in _TRANSIENT_STATUS
+    )
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds from an HTTP ``Retry-After`` header, if the error carries one."""
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return None
+    try:
+        return float(exc.response.headers.get("retry-after", ""))
+    except ValueError:
+        return None
+
+
+class AdaptiveLimiter:
+    """Semaphore with an AIMD-adjusted limit.
+
+    Args:
+        name: Label used in log messages.
+        initial: Starting concurrency limit.
+        min_limit: Floor the limit never drops below.
+        max_limit: Ceiling the limit never grows past.
+        increase_after: Consecutive successes needed to raise the limit by one.
+        max_per_minute: Optional cap on calls started per 60s window.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        increase_after: int = 10,
+        max_per_minute: Optional[int] = None,
+    ):
+        self.name = name
+        self.limit = initial
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_after = increase_after
+        self.max_per_minute = max_per_minute
+        self._started: deque[float] = deque()
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        if self.max_per_minute:
+            try:
+                await self._wait_for_window()
+            except BaseException:
+                await self.release(succeeded=False)
+                raise
+
+    async def _wait_for_window(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            while self._started and now - self._started[0] >= _RATE_WINDOW:
+                self._started.popleft()
+            if len(self._started) < self.max_per_minute:
+                self._started.append(now)
+                return
+            await asyncio.sleep(_RATE_WINDOW - (now - self._started[0]))
+
+    async def release(self, *, succeeded: bool, overloaded: bool = False) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            if overloaded:
+                new_limit = max(self.min_limit, self.limit // 2)
+                if new_limit != self.limit:
+                    logger.info("%s overloaded; concurrency %d -> %d", self.name, self.limit, new_limit)
+                self.limit = new_limit
+                self._successes = 0
+            elif succeeded:
+                self._successes += 1
+                if self._successes >= self.increase_after and self.limit < self.max_limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+
+def with_adaptive_retry(
+    limiter: AdaptiveLimiter,
+    *,
+    retries: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0,
+    is_overload: Callable[[BaseException], bool] = is_http_overload,
+    is_transient: Optional[Callable[[BaseException], bool]] = None,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Run the decorated coroutine under ``limiter``, retrying on overload.
+
+    Errors for which ``is_overload`` is true shrink the limit and are
+    retried (up to ``retries`` extra attempts); errors matching
+    ``is_transient`` are retried the same way but leave the limit alone.
+    Anything else is raised immediately. Backoff is capped at ``max_delay``
+    unless ``Retry-After`` asks for longer.
+    """
+
+    def decorator(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            attempt = 0
+            while True:
+                await limiter.acquire()
+                succeeded = overloaded = False
+                retry_after = None
+                try:
+                    result = await fn(*args, **kwargs)
+                    succeeded = True
+                    return result
+                except Exception as exc:
+                    overloaded = is_overload(exc)
+                    retryable = overloaded or (is_transient is not None and is_transient(exc))
+                    if not retryable or attempt >= retries:
+                        raise
+                    retry_after = _retry_after(exc)
+                    error = exc
+                finally:
+                    await limiter.release(succeeded=succeeded, overloaded=overloaded)
+                delay = min(max_delay, base_delay * (2 ** attempt) * (0.5 + random.random()))
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
+                attempt += 1
+                logger.warning(
+                    "%s retry %d/%d in %.2fs after %r", fn.__qualname__, attempt, retries, delay, error
+                )
+                await asyncio.sleep(delay)
+
+        return wrapper
+
+    return decorator
@@ -1,3 +1,3 @@
-from .client import ModulateService
+from .client import AudioTooLargeError, ModulateService
 
-__all__ = ["ModulateService"]
+__all__ = ["AudioTooLargeError", "ModulateService"]
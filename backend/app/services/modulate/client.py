@@ -8,15 +8,60 @@ Velma-2 capabilities used:
 
 Docs: https://modulate-developer-apis.com/web/docs.html
 """
-from typing import Any
+import asyncio
+import hashlib
+import os
+import re
+from types import MappingProxyType
+from typing import Any, BinaryIO, Optional, Union
 
 import httpx
+import orjson
 
 from app.config import settings
+from app.services.cache import AsyncTTLCache, make_key
 
 BATCH_ENDPOINT = "/api/velma-2-stt-batch"
 BATCH_FAST_ENDPOINT = "/api/velma-2-stt-batch-english-vfast"
 
+# Uploads can take a while to transcribe, but a dead host should fail fast
+_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+# Pool capped at the upload concurrency so sockets match the semaphore below
+_LIMITS = httpx.Limits(
+    max_connections=settings.MODULATE_MAX_CONCURRENCY,
+    max_keepalive_connections=settings.MODULATE_MAX_CONCURRENCY,
+)
+# Bounds simultaneous uploads (each up to MODULATE_MAX_BYTES) per process
+_upload_sem = asyncio.Semaphore(settings.MODULATE_MAX_CONCURRENCY)
+
+# Velma-2 transcripts keyed by audio content hash + model options, so the same
+# clip checked for several brands (or re-uploaded) is transcribed once.
+_transcript_cache = AsyncTTLCache(
+    maxsize=settings.MODULATE_CACHE_MAX_ENTRIES, ttl=settings.MODULATE_CACHE_TTL
+)
+_HASH_CHUNK = 1024 * 1024
+_ERROR_DETAIL_BYTES = 512
+
+_CONTENT_TYPES = MappingProxyType({
+    "mp3": "audio/mpeg",
+    "mp4": "video/mp4",
+    "mov": "video/quicktime",
+    "wav": "audio/wav",
+    "flac": "audio/flac",
+    "ogg": "audio/ogg",
+    "opus": "audio/opus",
+    "webm": "audio/webm",
+    "aac": "audio/aac",
+    "aiff": "audio/aiff",
+})
+
+# Raw bytes, an open binary file (streamed), or a path to one (opened and streamed)
+AudioSource = Union[bytes, BinaryIO, str, os.PathLike]
+
+
+class AudioTooLargeError(ValueError):
+    """Raised before uploading audio larger than MODULATE_MAX_BYTES."""
+
 
 class ModulateService:
     """Client for the Modulate Velma-2 speech-to-text API."""
@@ -24,25 +69,56 @@ class ModulateService:
     def __init__(self):
         self.api_key = settings.MODULATE_API_KEY
         self.base_url = settings.MODULATE_API_BASE_URL.rstrip("/")
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP/2 client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"X-API-Key": self.api_key},
+                timeout=_TIMEOUT,
+                limits=_LIMITS,
+                http2=True,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "ModulateService":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
     async def analyze_audio(
         self,
-        audio_bytes: bytes,
+        audio: AudioSource,
         filename: str,
         brand_name: str,
         speaker_diarization: bool = True,
         emotion_signal: bool = True,
-        fast_english: bool = False,
+        fast_english: Optional[bool] = None,
+        language: Optional[str] = None,
     ) -> dict[str, Any]:
         """Transcribe audio and extract utterances that mention the brand.
 
         Args:
-            audio_bytes: Raw audio file content.
+            audio: Raw audio bytes, an open binary file, or a file path.
+                Files are streamed into the multipart body in chunks rather
+                than read into memory first.
             filename: Original filename (used to infer content-type).
             brand_name: Brand name to filter utterances by.
             speaker_diarization: Enable per-speaker labelling.
             emotion_signal: Enable emotion detection per utterance.
-            fast_english: Use the English-optimised fast model instead of multilingual.
+            fast_english: Use the English-optimised fast model instead of
+                multilingual. Left as None, it is chosen from ``language``.
+            language: Spoken-language hint (e.g. "en", "en-US"). English
+                audio is sent to the fast model unless ``fast_english`` is
+                explicitly False.
 
         Returns:
             {
@@ -65,47 +141,90 @@ class ModulateService:
                 "all_utterances": [...],      # full utterance list for reference
             }
         """
+        payload = await self._get_transcript(
+            audio, filename, speaker_diarization, emotion_signal,
+            _use_fast_english(fast_english, language),
+        )
+        utterances = payload.get("utterances") or []
+        brand_mentions = _brand_mentions(utterances, brand_name)
+
+        return {
+            "text": payload.get("text", ""),
+            "duration_ms": payload.get("duration_ms", 0),
+            "brand_mentions": brand_mentions,
+            "total_mentions": len(brand_mentions),
+            "all_utterances": utterances,
+        }
+
+    async def _get_transcript(
+        self,
+        audio: AudioSource,
+        filename: str,
+        speaker_diarization: bool,
+        emotion_signal: bool,
+        fast_english: bool,
+    ) -> dict[str, Any]:
+        """Raw Velma-2 payload for ``audio``, from the cache when possible."""
         endpoint = BATCH_FAST_ENDPOINT if fast_english else BATCH_ENDPOINT
-        url = f"{self.base_url}{endpoint}"
 
-        content_type = _content_type_for(filename)
+        opened: BinaryIO | None = None
+        if isinstance(audio, (str, os.PathLike)):
+            opened = open(audio, "rb")
+            audio = opened
+        try:
+            size = _audio_size(audio)
+            if size is not None and size > settings.MODULATE_MAX_BYTES:
+                raise AudioTooLargeError(
+                    f"Audio is {size} bytes; Modulate uploads are limited to "
+                    f"{settings.MODULATE_MAX_BYTES} bytes"
+                )
+            # Hashing (and reading a file to hash it) is blocking work
+            digest = await asyncio.to_thread(_audio_digest, audio)
+            cache_key = (
+                make_key(digest, endpoint, speaker_diarization, emotion_signal)
+                if digest else None
+            )
+            payload = await _transcript_cache.get(cache_key) if cache_key else None
+            if payload is None:
+                payload = await self._transcribe(
+                    audio, filename, endpoint, speaker_diarization, emotion_signal
+                )
+                if cache_key:
+                    await _transcript_cache.set(cache_key, payload)
+            return payload
+        finally:
+            if opened is not None:
+                opened.close()
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                url,
-                headers={"X-API-Key": self.api_key},
-                files={"upload_file": (filename, audio_bytes, content_type)},
+    async def _transcribe(
+        self,
+        audio: bytes | BinaryIO,
+        filename: str,
+        endpoint: str,
+        speaker_diarization: bool,
+        emotion_signal: bool,
+    ) -> dict[str, Any]:
+        """POST the audio to Velma-2 and return the raw transcript payload."""
+        async with _upload_sem:
+            response = await self._get_client().post(
+                endpoint,
+                files={"upload_file": (filename, audio, _content_type_for(filename))},
                 data={
                     "speaker_diarization": str(speaker_diarization).lower(),
                     "emotion_signal": str(emotion_signal).lower(),
                 },
             )
-
         if response.status_code != 200:
-            raise RuntimeError(
-                f"Modulate API error {response.status_code}: {response.text}"
-            )
-
-        payload: dict[str, Any] = response.json()
+            # Only decode the head of the body; error dumps can be large
+            detail = response.content[:_ERROR_DETAIL_BYTES].decode("utf-8", errors="replace")
+            raise RuntimeError(f"Modulate API error {response.status_code}: {detail}")
+        # Transcripts can be large; orjson parses straight from bytes
+        return orjson.loads(response.content)
 
-        brand_lower = brand_name.lower()
-        brand_mentions = [
-            u for u in payload.get("utterances", [])
-            if brand_lower in u.get("text", "").lower()
-        ]
-
-        return {
-            "text": payload.get("text", ""),
-            "duration_ms": payload.get("duration_ms", 0),
-            "brand_mentions": brand_mentions,
-            "total_mentions": len(brand_mentions),
-            "all_utterances": payload.get("utterances", []),
-        }
-
-    async def check_voice_safety(self, audio_bytes: bytes, filename: str) -> dict[str, Any]:
+    async def check_voice_safety(self, audio: AudioSource, filename: str) -> dict[str, Any]:
         """Transcribe audio and return full utterance list with emotion/accent data."""
         return await self.analyze_audio(
-            audio_bytes=audio_bytes,
+            audio=audio,
             filename=filename,
             brand_name="",          # no brand filter — return everything
             speaker_diarization=True,
@@ -113,18 +232,57 @@ class ModulateService:
         )
 
 
+def _use_fast_english(fast_english: Optional[bool], language: Optional[str]) -> bool:
+    """An explicit flag wins; otherwise English-tagged audio takes the fast model."""
+    if fast_english is not None:
+        return fast_english
+    return bool(language) and language.lower().partition("-")[0] == "en"
+
+
+def _brand_mentions(utterances: list[dict[str, Any]], brand_name: str) -> list[dict[str, Any]]:
+    """Utterances whose text contains ``brand_name`` (case-insensitive).
+
+    An empty brand name matches everything.
+    """
+    if not brand_name:
+        return list(utterances)
+    # One case-insensitive search per utterance instead of lowercasing a copy of each
+    pattern = re.compile(re.escape(brand_name), re.IGNORECASE)
+    return [u for u in utterances if (text := u.get("text")) and pattern.search(text)]
+
+
+def _audio_size(audio: bytes | BinaryIO) -> int | None:
+    """Remaining bytes to upload, or None if the stream can't tell us."""
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        return len(audio)
+    if not (hasattr(audio, "seekable") and audio.seekable()):
+        return None
+    start = audio.tell()
+    end = audio.seek(0, os.SEEK_END)
+    audio.seek(start)
+    return end - start
+
+
+def _audio_digest(audio: bytes | BinaryIO) -> str | None:
+    """sha256 of the audio content, or None if it can't be re-read.
+
+    File objects are hashed in chunks and rewound so they can still be
+    streamed to the API afterwards.
+    """
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(audio).hexdigest()
+    if not (hasattr(audio, "seekable") and audio.seekable()):
+        return None
+    start = audio.tell()
+    h = hashlib.sha256()
+    buf = bytearray(_HASH_CHUNK)
+    view = memoryview(buf)
+    while n := audio.readinto(view):
+        h.update(view[:n])
+    audio.seek(start)
+    return h.hexdigest()
+
+
 def _content_type_for(filename: str) -> str:
-    ext = filename.rsplit(".", 1)[-1].lower()
-    mapping = {
-        "mp3": "audio/mpeg",
-        "mp4": "video/mp4",
-        "mov": "video/quicktime",
-        "wav": "audio/wav",
-        "flac": "audio/flac",
-        "ogg": "audio/ogg",
-        "opus": "audio/opus",
-        "webm": "audio/webm",
-        "aac": "audio/aac",
-        "aiff": "audio/aiff",
-    }
-    return mapping.get(ext, "application/octet-stream")
+    ext = filename.rpartition(".")[2].lower()
+    return _CONTENT_TYPES.get(ext, "application/octet-stream")
@@ -1,3 +1,4 @@
 from .client import Neo4jClient, get_neo4j_client
+from .batcher import MentionBatcher
 
-__all__ = ["Neo4jClient", "get_neo4j_client"]
+__all__ = ["Neo4jClient", "get_neo4j_client", "MentionBatcher"]
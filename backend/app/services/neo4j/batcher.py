@@ -0,0 +1,98 @@
+"""Coalesce concurrent mention writes into batched UNWIND queries.
+
+Callers ``await batcher.process(mention)`` exactly as they would
+``store_mention``; a background task drains the queue and flushes up to
+``max_batch_size`` mentions (or whatever arrived within
+``max_queue_time`` seconds) through ``Neo4jClient.store_mentions_bulk``.
+"""
+import asyncio
+import logging
+from typing import Any, Optional
+
+from .client import Neo4jClient
+
+logger = logging.getLogger(__name__)
+
+
+class MentionBatcher:
+    """Queue-backed batcher for ``Neo4jClient.store_mentions_bulk``.
+
+    Use as an async context manager so the flush task is started and
+    stopped with the work that feeds it::
+
+        async with MentionBatcher(client) as batcher:
+            results = await asyncio.gather(*(batcher.process(m) for m in mentions))
+    """
+
+    def __init__(
+        self,
+        client: Neo4jClient,
+        max_batch_size: int = 64,
+        max_queue_time: float = 0.05,
+    ):
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._queue: asyncio.Queue[tuple[dict[str, Any], asyncio.Future]] = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "MentionBatcher":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the flush task and fail anything still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while not self._queue.empty():
+            _, fut = self._queue.get_nowait()
+            if not fut.done():
+                fut.set_exception(RuntimeError("MentionBatcher closed"))
+
+    async def process(self, mention: dict[str, Any]) -> dict[str, Any]:
+        """Queue a mention and wait for its store result."""
+        if self._task is None:
+            raise RuntimeError("MentionBatcher is not running")
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((mention, fut))
+        return await fut
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_queue_time
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[tuple[dict[str, Any], asyncio.Future]]) -> None:
+        try:
+            results = await self.client.store_mentions_bulk([m for m, _ in batch])
+        except Exception as exc:
+            logger.warning("Batched store of %d mentions failed: %s", len(batch), exc)
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        for (_, fut), result in zip(batch, results):
+            if not fut.done():
+                fut.set_result(result)
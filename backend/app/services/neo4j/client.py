@@ -1,17 +1,22 @@
 """Neo4j knowledge graph client for BrandGuard.
 
 Manages the misinformation network graph:
-  Nodes  — Brand, Platform, Mention, Source, Correction
-  Edges  — ABOUT, FOUND_ON, SOURCED_FROM, FEEDS, CORRECTS, FOR_BRAND
+  Nodes  — Brand, Platform, Mention, Source, Correction, Scout
+  Edges  — ABOUT, FOUND_ON, SOURCED_FROM, FEEDS, CORRECTS, FOR_BRAND, MONITORS
 """
 import logging
+import re
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Optional
 
-from neo4j import AsyncGraphDatabase
+from neo4j import READ_ACCESS, AsyncGraphDatabase, RoutingControl
+from neo4j.exceptions import ServiceUnavailable, TransientError
 
 from app.config import settings
+from app.services.cache import AsyncTTLCache
+from app.services.limiter import AdaptiveLimiter, with_adaptive_retry
 
 logger = logging.getLogger(__name__)
 
@@ -26,20 +31,213 @@ NODE_COLORS = {
 }
 
 
+# ── Cypher ──────────────────────────────────────────────────────
+# Module-level constants so every call submits the identical string and
+# hits Neo4j's plan cache. Mentions MERGE on id so a redelivered scout
+# update (webhook retry, cron re-poll) is stored once.
+
+_STORE_MENTION_CYPHER = """
+MERGE (b:Brand {id: $brand_id})
+ON CREATE SET b.name = $brand_name
+MERGE (p:Platform {name: $platform})
+MERGE (m:Mention {id: $mention_id})
+ON CREATE SET
+    m.brand_id = $brand_id,
+    m.claim = $claim,
+    m.accuracy_score = $accuracy_score,
+    m.is_accurate = $is_accurate,
+    m.severity = $severity,
+    m.detected_at = $detected_at
+MERGE (m)-[:ABOUT]->(b)
+MERGE (m)-[:FOUND_ON]->(p)
+WITH m, p
+CALL {
+    WITH m, p
+    UNWIND $sources AS src
+    MERGE (s:Source {url: src.url})
+    ON CREATE SET s.domain = src.domain
+    MERGE (m)-[:SOURCED_FROM]->(s)
+    MERGE (s)-[:FEEDS]->(p)
+    RETURN count(src) AS src_count
+}
+RETURN m.id AS mention_id, elementId(m) AS neo4j_id, src_count
+"""
+
+_STORE_MENTIONS_BULK_CYPHER = """
+UNWIND $rows AS row
+MERGE (b:Brand {id: row.brand_id})
+ON CREATE SET b.name = row.brand_name
+MERGE (p:Platform {name: row.platform})
+MERGE (m:Mention {id: row.mention_id})
+ON CREATE SET
+    m.brand_id = row.brand_id,
+    m.claim = row.claim,
+    m.accuracy_score = row.accuracy_score,
+    m.is_accurate = row.is_accurate,
+    m.severity = row.severity,
+    m.detected_at = row.detected_at
+MERGE (m)-[:ABOUT]->(b)
+MERGE (m)-[:FOUND_ON]->(p)
+WITH m, p, row
+CALL {
+    WITH m, p, row
+    UNWIND row.sources AS src
+    MERGE (s:Source {url: src.url})
+    ON CREATE SET s.domain = src.domain
+    MERGE (m)-[:SOURCED_FROM]->(s)
+    MERGE (s)-[:FEEDS]->(p)
+    RETURN count(src) AS src_count
+}
+RETURN m.id AS mention_id, elementId(m) AS neo4j_id, src_count
+"""
+
+_STORE_CORRECTION_CYPHER = """
+MATCH (m:Mention {id: $mention_id})
+OPTIONAL MATCH (m)-[:ABOUT]->(about:Brand)
+WITH m, coalesce(m.brand_id, about.id) AS mention_brand
+MATCH (b:Brand {id: coalesce($brand_id, mention_brand)})
+WHERE mention_brand IS NULL OR b.id = mention_brand
+CREATE (c:Correction {
+    id: $correction_id,
+    content: $content,
+    type: $type,
+    status: $status,
+    created_at: $created_at
+})
+CREATE (c)-[:CORRECTS]->(m)
+CREATE (c)-[:FOR_BRAND]->(b)
+RETURN c.id AS correction_id, elementId(c) AS neo4j_id, b.id AS brand_id
+"""
+
+_STORE_CORRECTIONS_BULK_CYPHER = """
+UNWIND $rows AS row
+MATCH (m:Mention {id: row.mention_id})
+OPTIONAL MATCH (m)-[:ABOUT]->(about:Brand)
+WITH row, m, coalesce(m.brand_id, about.id) AS mention_brand
+MATCH (b:Brand {id: coalesce(row.brand_id, mention_brand)})
+WHERE mention_brand IS NULL OR b.id = mention_brand
+CREATE (c:Correction {
+    id: row.correction_id,
+    content: row.content,
+    type: row.type,
+    status: row.status,
+    created_at: row.created_at
+})
+CREATE (c)-[:CORRECTS]->(m)
+CREATE (c)-[:FOR_BRAND]->(b)
+RETURN c.id AS correction_id, elementId(c) AS neo4j_id, b.id AS brand_id
+"""
+
+_BRAND_HEALTH_CYPHER = """
+MATCH (b:Brand {id: $brand_id})<-[:ABOUT]-(m:Mention)-[:FOUND_ON]->(p:Platform)
+WITH p.name AS platform,
+     count(m) AS mentions,
+     avg(m.accuracy_score) AS avg_accuracy,
+     sum(m.accuracy_score) AS score_sum,
+     count(CASE WHEN m.is_accurate THEN 1 END) AS accurate_count,
+     count(CASE WHEN m.severity IN ['high', 'critical'] THEN 1 END) AS threats
+WITH sum(mentions) AS total_mentions,
+     sum(score_sum) AS score_sum,
+     sum(accurate_count) AS accurate_mentions,
+     sum(threats) AS threats,
+     collect({platform: platform, accuracy: avg_accuracy, mentions: mentions}) AS by_platform
+RETURN total_mentions,
+       CASE WHEN total_mentions > 0 THEN score_sum / total_mentions ELSE 0 END AS overall_accuracy,
+       accurate_mentions,
+       threats,
+       by_platform
+"""
+
+_BRAND_SOURCES_CYPHER = """
+MATCH (m:Mention {brand_id: $brand_id, is_accurate: false})-[:SOURCED_FROM]->(s:Source)
+OPTIONAL MATCH (s)-[:FEEDS]->(p:Platform)
+RETURN s.url AS url,
+       s.domain AS domain,
+       count(DISTINCT m) AS mentions_fed,
+       collect(DISTINCT p.name) AS platforms_affected
+ORDER BY mentions_fed DESC
+LIMIT $limit
+"""
+
+_BRAND_NETWORK_CYPHER = """
+MATCH (b:Brand {id: $brand_id})
+OPTIONAL MATCH (m:Mention)-[:ABOUT]->(b)
+OPTIONAL MATCH (m)-[:FOUND_ON]->(p:Platform)
+OPTIONAL MATCH (m)-[:SOURCED_FROM]->(s:Source)
+OPTIONAL MATCH (s)-[:FEEDS]->(p2:Platform)
+OPTIONAL MATCH (c:Correction)-[:CORRECTS]->(m)
+RETURN DISTINCT b.name AS bname,
+       m.id AS mid, m.claim AS claim, m.accuracy_score AS acc, m.is_accurate AS is_acc,
+       p.name AS pname,
+       s.url AS surl, s.domain AS sdom,
+       p2.name AS p2name,
+       c.id AS cid, c.content AS ccontent
+"""
+
+
+_LINK_SCOUT_CYPHER = """
+MERGE (b:Brand {id: $brand_id})
+ON CREATE SET b.name = $brand_name
+MERGE (s:Scout {id: $scout_id})
+MERGE (s)-[:MONITORS]->(b)
+"""
+
+_SCOUT_BRANDS_CYPHER = """
+MATCH (s:Scout)-[:MONITORS]->(b:Brand)
+RETURN s.id AS scout_id, b.id AS brand_id, b.name AS brand_name, s.last_seen AS last_seen
+"""
+
+_SET_SCOUT_CURSORS_CYPHER = """
+UNWIND $rows AS row
+MATCH (s:Scout {id: row.scout_id})
+SET s.last_seen = row.last_seen
+"""
+
+_SCOUT_BRAND_CYPHER = """
+MATCH (:Scout {id: $scout_id})-[:MONITORS]->(b:Brand)
+RETURN b.id AS brand_id, b.name AS brand_name
+LIMIT 1
+"""
+
+
+def _is_neo4j_overload(exc: BaseException) -> bool:
+    return isinstance(exc, (TransientError, ServiceUnavailable))
+
+
+_bulk_write_limiter = AdaptiveLimiter("neo4j.store_mentions_bulk")
+
+# Cache-aside for the per-brand dashboard reads, which are polled far more
+# often than brand data changes. Writes below invalidate the brand's entries.
+_read_cache = AsyncTTLCache(maxsize=1024, ttl=settings.NEO4J_READ_CACHE_TTL)
+
+
 class Neo4jClient:
-    """Async client for the Neo4j knowledge graph."""
+    """Async client for the Neo4j knowledge graph.
+
+    Expects ``neo4j-rust-ext`` to be installed alongside the driver; it
+    swaps in a Rust PackStream codec, which matters for the large node
+    maps returned by ``get_brand_network``.
+    """
 
     def __init__(
         self,
         uri: str | None = None,
         username: str | None = None,
         password: str | None = None,
+        database: str | None = None,
     ):
         self.uri = uri or settings.NEO4J_URI
         self.username = username or settings.NEO4J_USER
         self.password = password or settings.NEO4J_PASSWORD
+        # Naming the database skips the home-database routing round-trip
+        self.database = database or settings.NEO4J_DATABASE or "neo4j"
         self.driver = AsyncGraphDatabase.driver(
-            self.uri, auth=(self.username, self.password)
+            self.uri,
+            auth=(self.username, self.password),
+            max_connection_pool_size=settings.NEO4J_POOL_SIZE,
+            connection_acquisition_timeout=settings.NEO4J_ACQUIRE_TIMEOUT,
+            max_connection_lifetime=settings.NEO4J_MAX_CONNECTION_LIFETIME,
+            keep_alive=True,
         )
 
     async def close(self):
@@ -56,12 +254,39 @@ class Neo4jClient:
     # ── Low-level query helper ──────────────────────────────────
 
     async def run_query(
-        self, query: str, params: dict | None = None
+        self,
+        query: str,
+        params: dict | None = None,
+        routing: RoutingControl = RoutingControl.WRITE,
     ) -> list[dict[str, Any]]:
-        """Execute a Cypher query and return result records as dicts."""
-        async with self.driver.session() as session:
-            result = await session.run(query, params or {})
-            return [record.data() async for record in result]
+        """Execute a Cypher query and return result records as dicts.
+
+        Runs in a managed transaction, so the driver retries transient
+        failures itself. Pass ``routing=RoutingControl.READ`` for read-only
+        queries so a cluster can serve them from any member.
+        """
+        records, _, _ = await self.driver.execute_query(
+            query,
+            parameters_=params if params is not None else {},
+            database_=self.database,
+            routing_=routing,
+        )
+        return [record.data() for record in records]
+
+    async def run_query_iter(
+        self, query: str, params: dict | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream a read-only query's records as dicts as they arrive.
+
+        Unlike ``run_query`` nothing is materialized up front, so large
+        results can be consumed incrementally. No automatic retry.
+        """
+        async with self.driver.session(
+            database=self.database, default_access_mode=READ_ACCESS
+        ) as session:
+            result = await session.run(query, params if params is not None else {})
+            async for record in result:
+                yield record.data()
 
     # ── Schema initialization ───────────────────────────────────
 
@@ -73,19 +298,27 @@ class Neo4jClient:
             "CREATE CONSTRAINT mention_id IF NOT EXISTS FOR (m:Mention) REQUIRE m.id IS UNIQUE",
             "CREATE CONSTRAINT source_url IF NOT EXISTS FOR (s:Source) REQUIRE s.url IS UNIQUE",
             "CREATE CONSTRAINT correction_id IF NOT EXISTS FOR (c:Correction) REQUIRE c.id IS UNIQUE",
+            "CREATE CONSTRAINT scout_id IF NOT EXISTS FOR (s:Scout) REQUIRE s.id IS UNIQUE",
             "CREATE INDEX mention_accuracy IF NOT EXISTS FOR (m:Mention) ON (m.accuracy_score)",
             "CREATE INDEX mention_date IF NOT EXISTS FOR (m:Mention) ON (m.detected_at)",
+            "CREATE INDEX mention_brand_accuracy IF NOT EXISTS FOR (m:Mention) ON (m.brand_id, m.is_accurate)",
         ]
-        async with self.driver.session() as session:
+        platforms = ["chatgpt", "claude", "perplexity", "gemini"]
+        async with self.driver.session(database=self.database) as session:
             for stmt in statements:
                 try:
                     await session.run(stmt)
                 except Exception as exc:
                     logger.warning("Schema statement skipped: %s — %s", stmt[:60], exc)
-
-        platforms = ["chatgpt", "claude", "perplexity", "gemini"]
-        for name in platforms:
-            await self.run_query("MERGE (:Platform {name: $name})", {"name": name})
+            await session.run(
+                "UNWIND $names AS name MERGE (:Platform {name: name})",
+                {"names": platforms},
+            )
+            # Mentions stored before brand_id was denormalized onto them
+            await session.run(
+                "MATCH (m:Mention)-[:ABOUT]->(b:Brand) WHERE m.brand_id IS NULL "
+                "SET m.brand_id = b.id"
+            )
 
         logger.info("Neo4j schema initialized with %d platform nodes", len(platforms))
 
@@ -97,161 +330,203 @@ class Neo4jClient:
         Expected mention keys:
             id, brand_id, brand_name, platform, claim, accuracy_score,
             severity, detected_at, source_urls (list[str])
+
+        A mention whose ``id`` is already stored keeps its properties;
+        storing it again only adds edges that are missing.
         """
-        mention_id = mention.get("id") or str(uuid.uuid4())
-        detected_at = mention.get("detected_at") or datetime.now(timezone.utc).isoformat()
-        is_accurate = mention.get("accuracy_score", 0) >= 70
-
-        query = """
-        MERGE (b:Brand {id: $brand_id})
-        ON CREATE SET b.name = $brand_name
-        MERGE (p:Platform {name: $platform})
-        CREATE (m:Mention {
-            id: $mention_id,
-            claim: $claim,
-            accuracy_score: $accuracy_score,
-            is_accurate: $is_accurate,
-            severity: $severity,
-            detected_at: $detected_at
-        })
-        CREATE (m)-[:ABOUT]->(b)
-        CREATE (m)-[:FOUND_ON]->(p)
-        RETURN m.id AS mention_id, elementId(m) AS neo4j_id
-        """
-        params = {
-            "brand_id": mention["brand_id"],
-            "brand_name": mention.get("brand_name", mention["brand_id"]),
-            "platform": mention["platform"],
-            "mention_id": mention_id,
-            "claim": mention["claim"],
-            "accuracy_score": float(mention.get("accuracy_score", 0)),
-            "is_accurate": is_accurate,
-            "severity": mention.get("severity", "medium"),
-            "detected_at": str(detected_at),
-        }
-        records = await self.run_query(query, params)
-        neo4j_id = records[0]["neo4j_id"] if records else None
-
-        rels_created = 2  # ABOUT + FOUND_ON
-        source_urls = mention.get("source_urls", [])
-        for url in source_urls:
-            domain = _extract_domain(url)
-            src_query = """
-            MATCH (m:Mention {id: $mention_id})
-            MATCH (p:Platform {name: $platform})
-            MERGE (s:Source {url: $url})
-            ON CREATE SET s.domain = $domain
-            CREATE (m)-[:SOURCED_FROM]->(s)
-            MERGE (s)-[:FEEDS]->(p)
-            """
-            await self.run_query(
-                src_query,
-                {
-                    "mention_id": mention_id,
-                    "platform": mention["platform"],
-                    "url": url,
-                    "domain": domain,
-                },
-            )
-            rels_created += 2  # SOURCED_FROM + FEEDS
+        params = _mention_params(mention)
+        params["sources"] = [
+            {"url": url, "domain": _extract_domain(url)}
+            for url in mention.get("source_urls", [])
+        ]
+
+        records = await self.run_query(_STORE_MENTION_CYPHER, params)
+        record = records[0] if records else {}
+        await _invalidate_brand(params["brand_id"])
 
         return {
-            "neo4j_id": neo4j_id,
-            "mention_id": mention_id,
-            "relationships_created": rels_created,
+            "neo4j_id": record.get("neo4j_id"),
+            "mention_id": params["mention_id"],
+            # ABOUT + FOUND_ON, plus SOURCED_FROM + FEEDS per source
+            "relationships_created": 2 + 2 * record.get("src_count", 0),
         }
 
+    async def store_mentions_bulk(
+        self, mentions: list[dict[str, Any]], batch_size: int = 500
+    ) -> list[dict[str, Any]]:
+        """Store many mentions (and their sources) with one UNWIND query per batch.
+
+        Takes the same mention dicts as ``store_mention`` and returns one
+        result dict per input, in input order. Each batch of ``batch_size``
+        mentions is its own transaction.
+        """
+        rows = []
+        for mention in mentions:
+            row = _mention_params(mention)
+            row["sources"] = [
+                {"url": url, "domain": _extract_domain(url)}
+                for url in mention.get("source_urls", [])
+            ]
+            rows.append(row)
+
+        results = []
+        for start in range(0, len(rows), batch_size):
+            results.extend(await self._store_mention_rows(rows[start:start + batch_size]))
+        for brand_id in {row["brand_id"] for row in rows}:
+            await _invalidate_brand(brand_id)
+        return results
+
+    @with_adaptive_retry(_bulk_write_limiter, is_overload=_is_neo4j_overload)
+    async def _store_mention_rows(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        records = await self.run_query(_STORE_MENTIONS_BULK_CYPHER, {"rows": rows})
+        by_id = {r["mention_id"]: r for r in records}
+
+        results = []
+        for row in rows:
+            record = by_id.get(row["mention_id"], {})
+            results.append({
+                "neo4j_id": record.get("neo4j_id"),
+                "mention_id": row["mention_id"],
+                "relationships_created": 2 + 2 * record.get("src_count", 0),
+            })
+        return results
+
     # ── Store a correction ──────────────────────────────────────
 
     async def store_correction(self, correction: dict[str, Any]) -> dict[str, Any]:
-        """Store a correction linked to a mention and brand."""
-        correction_id = correction.get("id") or str(uuid.uuid4())
-        created_at = correction.get("created_at") or datetime.now(timezone.utc).isoformat()
-
-        query = """
-        MATCH (m:Mention {id: $mention_id})
-        MATCH (m)-[:ABOUT]->(b:Brand)
-        CREATE (c:Correction {
-            id: $correction_id,
-            content: $content,
-            type: $type,
-            status: $status,
-            created_at: $created_at
-        })
-        CREATE (c)-[:CORRECTS]->(m)
-        CREATE (c)-[:FOR_BRAND]->(b)
-        RETURN c.id AS correction_id, elementId(c) AS neo4j_id
+        """Store a correction linked to a mention and brand.
+
+        ``brand_id`` is optional; when omitted the mention's brand is used
+        (its ``brand_id`` property, or its ABOUT edge for mentions stored
+        before that property existed).
+
+        Raises:
+            ValueError: The mention doesn't exist, or ``brand_id`` names a
+                different brand than the mention is about.
+        """
+        params = _correction_params(correction)
+        records = await self.run_query(_STORE_CORRECTION_CYPHER, params)
+        if not records:
+            raise ValueError(
+                f"Mention {params['mention_id']!r} not found"
+                + (f" for brand {params['brand_id']!r}" if params["brand_id"] else "")
+            )
+        await _invalidate_brand(records[0]["brand_id"])
+        return {"neo4j_id": records[0]["neo4j_id"], "correction_id": params["correction_id"]}
+
+    async def store_corrections_bulk(
+        self, corrections: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Store many corrections in one UNWIND write.
+
+        Takes the same dicts as ``store_correction`` and returns one result
+        per input, in input order. Corrections whose mention does not exist,
+        or whose ``brand_id`` doesn't match the mention's brand, are not
+        stored and come back with ``neo4j_id`` None.
+        """
+        if not corrections:
+            return []
+        rows = [_correction_params(c) for c in corrections]
+        records = await self.run_query(_STORE_CORRECTIONS_BULK_CYPHER, {"rows": rows})
+        by_id = {r["correction_id"]: r for r in records}
+        for brand_id in {r["brand_id"] for r in records}:
+            await _invalidate_brand(brand_id)
+        return [
+            {
+                "neo4j_id": by_id.get(row["correction_id"], {}).get("neo4j_id"),
+                "correction_id": row["correction_id"],
+            }
+            for row in rows
+        ]
+
+    # ── Scouts ──────────────────────────────────────────────────
+
+    async def link_scout(self, scout_id: str, brand_id: str, brand_name: str) -> None:
+        """Record which brand a Yutori scout monitors."""
+        await self.run_query(
+            _LINK_SCOUT_CYPHER,
+            {"scout_id": scout_id, "brand_id": brand_id, "brand_name": brand_name},
+        )
+
+    async def unlink_scout(self, scout_id: str) -> None:
+        """Forget a stopped or deleted scout."""
+        await self.run_query("MATCH (s:Scout {id: $scout_id}) DETACH DELETE s", {"scout_id": scout_id})
+
+    async def get_scout_brand(self, scout_id: str) -> Optional[dict[str, Any]]:
+        """``{brand_id, brand_name}`` for a scout, or None if it isn't linked."""
+        records = await self.run_query(
+            _SCOUT_BRAND_CYPHER, {"scout_id": scout_id}, routing=RoutingControl.READ
+        )
+        return records[0] if records else None
+
+    async def get_scout_brands(self) -> dict[str, dict[str, Any]]:
+        """Every linked scout, as scout_id -> ``{brand_id, brand_name, last_seen}``.
+
+        ``last_seen`` is the newest update timestamp the cron has stored for
+        the scout (None before its first poll).
         """
-        params = {
-            "mention_id": correction["mention_id"],
-            "correction_id": correction_id,
-            "content": correction.get("content", ""),
-            "type": correction.get("correction_type", "blog_post"),
-            "status": correction.get("status", "draft"),
-            "created_at": str(created_at),
+        records = await self.run_query(_SCOUT_BRANDS_CYPHER, routing=RoutingControl.READ)
+        return {
+            r["scout_id"]: {
+                "brand_id": r["brand_id"],
+                "brand_name": r["brand_name"],
+                "last_seen": r["last_seen"],
+            }
+            for r in records
         }
-        records = await self.run_query(query, params)
-        neo4j_id = records[0]["neo4j_id"] if records else None
-        return {"neo4j_id": neo4j_id, "correction_id": correction_id}
+
+    async def set_scout_cursors(self, cursors: dict[str, str]) -> None:
+        """Record each scout's newest stored update timestamp (scout_id -> timestamp)."""
+        if not cursors:
+            return
+        rows = [{"scout_id": k, "last_seen": v} for k, v in cursors.items()]
+        await self.run_query(_SET_SCOUT_CURSORS_CYPHER, {"rows": rows})
 
     # ── Brand health ────────────────────────────────────────────
 
     async def get_brand_health(self, brand_id: str) -> dict[str, Any]:
         """Accuracy breakdown by platform for a brand."""
-        query = """
-        MATCH (m:Mention)-[:ABOUT]->(b:Brand {id: $brand_id})
-        MATCH (m)-[:FOUND_ON]->(p:Platform)
-        RETURN p.name AS platform,
-               count(m) AS mentions,
-               avg(m.accuracy_score) AS avg_accuracy,
-               sum(CASE WHEN m.is_accurate THEN 1 ELSE 0 END) AS accurate_count,
-               sum(CASE WHEN m.severity IN ['high', 'critical'] THEN 1 ELSE 0 END) AS threats
-        """
-        records = await self.run_query(query, {"brand_id": brand_id})
-
-        by_platform = {}
-        total_mentions = 0
-        total_accurate = 0
-        total_threats = 0
-        weighted_sum = 0.0
-
-        for r in records:
-            plat = r["platform"]
-            count = r["mentions"]
-            acc = round(r["avg_accuracy"], 1) if r["avg_accuracy"] is not None else 0
-            by_platform[plat] = {"accuracy": acc, "mentions": count}
-            total_mentions += count
-            total_accurate += r["accurate_count"]
-            total_threats += r["threats"]
-            weighted_sum += (r["avg_accuracy"] or 0) * count
-
-        overall = round(weighted_sum / total_mentions, 1) if total_mentions else 0
+        cache_key = f"health:{brand_id}"
+        cached = await _read_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        return {
-            "overall_accuracy": overall,
-            "total_mentions": total_mentions,
-            "accurate_mentions": total_accurate,
-            "threats": total_threats,
-            "by_platform": by_platform,
+        records = await self.run_query(
+            _BRAND_HEALTH_CYPHER, {"brand_id": brand_id}, routing=RoutingControl.READ
+        )
+
+        r = records[0]
+        health = {
+            "overall_accuracy": round(r["overall_accuracy"], 1) if r["total_mentions"] else 0,
+            "total_mentions": r["total_mentions"],
+            "accurate_mentions": r["accurate_mentions"],
+            "threats": r["threats"],
+            "by_platform": {
+                p["platform"]: {
+                    "accuracy": round(p["accuracy"], 1) if p["accuracy"] is not None else 0,
+                    "mentions": p["mentions"],
+                }
+                for p in r["by_platform"]
+            },
         }
+        await _read_cache.set(cache_key, health)
+        return health
 
     # ── Top misinformation sources ──────────────────────────────
 
     async def get_brand_sources(self, brand_id: str, limit: int = 20) -> list[dict[str, Any]]:
         """Rank sources by how many inaccurate mentions they feed."""
-        query = """
-        MATCH (s:Source)<-[:SOURCED_FROM]-(m:Mention)-[:ABOUT]->(b:Brand {id: $brand_id})
-        WHERE m.accuracy_score < 70
-        OPTIONAL MATCH (s)-[:FEEDS]->(p:Platform)
-        RETURN s.url AS url,
-               s.domain AS domain,
-               count(DISTINCT m) AS mentions_fed,
-               collect(DISTINCT p.name) AS platforms_affected
-        ORDER BY mentions_fed DESC
-        LIMIT $limit
-        """
-        records = await self.run_query(query, {"brand_id": brand_id, "limit": limit})
-        return [
+        cache_key = f"sources:{brand_id}:{limit}"
+        cached = await _read_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        records = await self.run_query(
+            _BRAND_SOURCES_CYPHER,
+            {"brand_id": brand_id, "limit": limit},
+            routing=RoutingControl.READ,
+        )
+        sources = [
             {
                 "url": r["url"],
                 "domain": r["domain"],
@@ -260,143 +535,114 @@ class Neo4jClient:
             }
             for r in records
         ]
+        await _read_cache.set(cache_key, sources)
+        return sources
 
     # ── Full graph for visualization ────────────────────────────
 
     async def get_brand_network(self, brand_id: str) -> dict[str, Any]:
         """Return nodes + edges for the brand's knowledge graph."""
-        query = """
-        MATCH (b:Brand {id: $brand_id})
-        OPTIONAL MATCH (m:Mention)-[:ABOUT]->(b)
-        OPTIONAL MATCH (m)-[:FOUND_ON]->(p:Platform)
-        OPTIONAL MATCH (m)-[:SOURCED_FROM]->(s:Source)
-        OPTIONAL MATCH (c:Correction)-[:CORRECTS]->(m)
-        RETURN b, collect(DISTINCT m) AS mentions,
-               collect(DISTINCT p) AS platforms,
-               collect(DISTINCT s) AS sources,
-               collect(DISTINCT c) AS corrections
-        """
-        records = await self.run_query(query, {"brand_id": brand_id})
-        if not records:
-            return {"nodes": [], "edges": []}
+        cache_key = f"network:{brand_id}"
+        cached = await _read_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
+        bid = f"brand-{brand_id}"
         nodes: dict[str, dict] = {}
         edges: list[dict] = []
-
-        for record in records:
-            brand = record["b"]
-            if brand:
-                bid = f"brand-{brand['id']}"
+        # One set per edge type keeps the keys homogeneous and small
+        seen_found_on: set[tuple[str, str]] = set()
+        seen_sourced_from: set[tuple[str, str]] = set()
+        seen_feeds: set[tuple[str, str]] = set()
+        seen_corrects: set[tuple[str, str]] = set()
+
+        # Each row is one flat mention/platform/source/correction combination,
+        # so nodes and edges are built as rows stream in
+        async for r in self.run_query_iter(_BRAND_NETWORK_CYPHER, {"brand_id": brand_id}):
+            if not nodes:
                 nodes[bid] = {
                     "id": bid,
                     "type": "Brand",
-                    "label": brand.get("name", brand["id"]),
+                    "label": r["bname"] or brand_id,
                     "color": NODE_COLORS["Brand"],
                 }
-
-            for m in record.get("mentions") or []:
-                if m is None:
-                    continue
-                mid = f"mention-{m['id']}"
-                is_acc = m.get("is_accurate", m.get("accuracy_score", 0) >= 70)
+            if r["mid"] is None:
+                continue
+            mid = f"mention-{r['mid']}"
+            if mid not in nodes:
+                is_acc = r["is_acc"]
+                if is_acc is None:
+                    is_acc = (r["acc"] or 0) >= 70
                 color_key = "Mention_accurate" if is_acc else "Mention_inaccurate"
                 nodes[mid] = {
                     "id": mid,
                     "type": "Mention",
-                    "label": (m.get("claim") or "")[:50],
+                    "label": (r["claim"] or "")[:50],
                     "color": NODE_COLORS[color_key],
-                    "accuracy": m.get("accuracy_score"),
-                }
-                edges.append({"source": mid, "target": f"brand-{brand_id}", "type": "ABOUT"})
-
-            for p in record.get("platforms") or []:
-                if p is None:
-                    continue
-                pid = f"platform-{p['name']}"
-                nodes[pid] = {
-                    "id": pid,
-                    "type": "Platform",
-                    "label": p["name"].title(),
-                    "color": NODE_COLORS["Platform"],
-                }
-
-            for s in record.get("sources") or []:
-                if s is None:
-                    continue
-                sid = f"source-{s['url']}"
-                nodes[sid] = {
-                    "id": sid,
-                    "type": "Source",
-                    "label": s.get("domain", s["url"]),
-                    "color": NODE_COLORS["Source"],
-                }
-
-            for c in record.get("corrections") or []:
-                if c is None:
-                    continue
-                cid = f"correction-{c['id']}"
-                nodes[cid] = {
-                    "id": cid,
-                    "type": "Correction",
-                    "label": (c.get("content") or "")[:40],
-                    "color": NODE_COLORS["Correction"],
+                    "accuracy": r["acc"],
                 }
-
-        rel_query = """
-        MATCH (b:Brand {id: $brand_id})
-        OPTIONAL MATCH (m:Mention)-[r1:ABOUT]->(b)
-        OPTIONAL MATCH (m)-[r2:FOUND_ON]->(p:Platform)
-        OPTIONAL MATCH (m)-[r3:SOURCED_FROM]->(s:Source)
-        OPTIONAL MATCH (s)-[r4:FEEDS]->(p2:Platform)
-        OPTIONAL MATCH (c:Correction)-[r5:CORRECTS]->(m)
-        RETURN m.id AS mid, p.name AS pname, s.url AS surl,
-               p2.name AS p2name, c.id AS cid
-        """
-        rels = await self.run_query(rel_query, {"brand_id": brand_id})
-        seen_edges: set[tuple] = set()
-
-        for r in rels:
-            mid = r.get("mid")
-            if mid:
-                key_found = (f"mention-{mid}", r.get("pname"))
-                if r.get("pname") and key_found not in seen_edges:
-                    edges.append({
-                        "source": f"mention-{mid}",
-                        "target": f"platform-{r['pname']}",
-                        "type": "FOUND_ON",
-                    })
-                    seen_edges.add(key_found)
-
-                key_src = (f"mention-{mid}", r.get("surl"))
-                if r.get("surl") and key_src not in seen_edges:
-                    edges.append({
-                        "source": f"mention-{mid}",
-                        "target": f"source-{r['surl']}",
-                        "type": "SOURCED_FROM",
-                    })
-                    seen_edges.add(key_src)
-
-            if r.get("surl") and r.get("p2name"):
-                key_feeds = (r["surl"], r["p2name"])
-                if key_feeds not in seen_edges:
-                    edges.append({
-                        "source": f"source-{r['surl']}",
-                        "target": f"platform-{r['p2name']}",
-                        "type": "FEEDS",
-                    })
-                    seen_edges.add(key_feeds)
-
-            if r.get("cid") and mid:
-                key_corr = (r["cid"], mid)
-                if key_corr not in seen_edges:
-                    edges.append({
-                        "source": f"correction-{r['cid']}",
-                        "target": f"mention-{mid}",
-                        "type": "CORRECTS",
-                    })
-                    seen_edges.add(key_corr)
-
-        return {"nodes": list(nodes.values()), "edges": edges}
+                edges.append({"source": mid, "target": bid, "type": "ABOUT"})
+
+            pname = r["pname"]
+            if pname is not None:
+                pid = f"platform-{pname}"
+                if pid not in nodes:
+                    nodes[pid] = {
+                        "id": pid,
+                        "type": "Platform",
+                        "label": pname.title(),
+                        "color": NODE_COLORS["Platform"],
+                    }
+                key_found = (mid, pid)
+                if key_found not in seen_found_on:
+                    edges.append({"source": mid, "target": pid, "type": "FOUND_ON"})
+                    seen_found_on.add(key_found)
+
+            surl = r["surl"]
+            if surl is not None:
+                sid = f"source-{surl}"
+                if sid not in nodes:
+                    nodes[sid] = {
+                        "id": sid,
+                        "type": "Source",
+                        "label": r["sdom"] or surl,
+                        "color": NODE_COLORS["Source"],
+                    }
+                key_src = (mid, sid)
+                if key_src not in seen_sourced_from:
+                    edges.append({"source": mid, "target": sid, "type": "SOURCED_FROM"})
+                    seen_sourced_from.add(key_src)
+
+                p2name = r["p2name"]
+                if p2name is not None:
+                    key_feeds = (sid, p2name)
+                    if key_feeds not in seen_feeds:
+                        edges.append({
+                            "source": sid,
+                            "target": f"platform-{p2name}",
+                            "type": "FEEDS",
+                        })
+                        seen_feeds.add(key_feeds)
+
+            if r["cid"] is not None:
+                cid = f"correction-{r['cid']}"
+                if cid not in nodes:
+                    nodes[cid] = {
+                        "id": cid,
+                        "type": "Correction",
+                        "label": (r["ccontent"] or "")[:40],
+                        "color": NODE_COLORS["Correction"],
+                    }
+                key_corr = (cid, mid)
+                if key_corr not in seen_corrects:
+                    edges.append({"source": cid, "target": mid, "type": "CORRECTS"})
+                    seen_corrects.add(key_corr)
+
+        if not nodes:
+            return {"nodes": [], "edges": []}
+        network = {"nodes": list(nodes.values()), "edges": edges}
+        await _read_cache.set(cache_key, network)
+        return network
 
 
 # ── Singleton accessor ──────────────────────────────────────────
@@ -414,10 +660,48 @@ def get_neo4j_client() -> Neo4jClient:
 
 # ── Utility ─────────────────────────────────────────────────────
 
+async def _invalidate_brand(brand_id: str) -> None:
+    """Drop cached health/sources/network reads for a brand after a write."""
+    await _read_cache.delete(f"health:{brand_id}")
+    await _read_cache.delete(f"network:{brand_id}")
+    await _read_cache.delete_prefix(f"sources:{brand_id}:")
+
+
+def _mention_params(mention: dict[str, Any]) -> dict[str, Any]:
+    """Normalize a mention dict into Cypher parameters."""
+    detected_at = mention.get("detected_at") or datetime.now(timezone.utc).isoformat()
+    return {
+        "brand_id": mention["brand_id"],
+        "brand_name": mention.get("brand_name", mention["brand_id"]),
+        "platform": mention["platform"],
+        "mention_id": mention.get("id") or str(uuid.uuid4()),
+        "claim": mention["claim"],
+        "accuracy_score": float(mention.get("accuracy_score", 0)),
+        "is_accurate": mention.get("accuracy_score", 0) >= 70,
+        "severity": mention.get("severity", "medium"),
+        "detected_at": str(detected_at),
+    }
+
+
+def _correction_params(correction: dict[str, Any]) -> dict[str, Any]:
+    """Normalize a correction dict into Cypher parameters."""
+    created_at = correction.get("created_at") or datetime.now(timezone.utc).isoformat()
+    return {
+        "mention_id": correction["mention_id"],
+        "brand_id": correction.get("brand_id"),
+        "correction_id": correction.get("id") or str(uuid.uuid4()),
+        "content": correction.get("content", ""),
+        "type": correction.get("correction_type", "blog_post"),
+        "status": correction.get("status", "draft"),
+        "created_at": str(created_at),
+    }
+
+
+_DOMAIN_RE = re.compile(r"^[a-z][a-z0-9+.-]*://([^/?#]+)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
 def _extract_domain(url: str) -> str:
-    """Pull the domain from a URL."""
-    from urllib.parse import urlparse
-    try:
-        return urlparse(url).netloc or url
-    except Exception:
-        return url
+    """Pull the domain from a URL (source URLs repeat across mentions)."""
+    match = _DOMAIN_RE.match(url)
+    return match.group(1) if match else url
@@ -0,0 +1,90 @@
+"""Process-wide service client instances.
+
+Each factory builds its client on first call and returns the same instance
+afterwards, so every router, pipeline and orchestrator shares one
+connection pool per upstream. ``warm_clients`` and ``close_clients`` are
+called on app startup and shutdown.
+
+Factories whose constructor raises (e.g. a missing API key) cache nothing
+and will retry on the next call.
+"""
+import asyncio
+import logging
+from functools import lru_cache
+
+from app.services.modulate import ModulateService
+from app.services.neo4j import Neo4jClient, get_neo4j_client
+from app.services.senso import SensoGEOClient, SensoSDKClient
+from app.services.tavily import TavilyClient
+from app.services.yutori import YutoriClient
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def get_senso_geo() -> SensoGEOClient:
+    return SensoGEOClient()
+
+
+@lru_cache(maxsize=None)
+def get_senso_sdk() -> SensoSDKClient:
+    return SensoSDKClient()
+
+
+@lru_cache(maxsize=None)
+def get_tavily() -> TavilyClient:
+    return TavilyClient()
+
+
+@lru_cache(maxsize=None)
+def get_neo4j() -> Neo4jClient:
+    # Same driver the graph/monitoring routers get from get_neo4j_client()
+    return get_neo4j_client()
+
+
+@lru_cache(maxsize=None)
+def get_yutori() -> YutoriClient:
+    return YutoriClient()
+
+
+@lru_cache(maxsize=None)
+def get_modulate() -> ModulateService:
+    return ModulateService()
+
+
+# Clients whose pools are opened at startup so the first request skips DNS/TCP/TLS
+_WARM_FACTORIES = (get_tavily, get_yutori)
+_WARM_TIMEOUT = 5.0
+
+_FACTORIES = (get_senso_geo, get_senso_sdk, get_tavily, get_neo4j, get_yutori, get_modulate)
+
+
+async def close_clients() -> None:
+    """Close every client that has been created, then forget it."""
+    for factory in _FACTORIES:
+        if not factory.cache_info().currsize:
+            continue
+        client = factory()
+        closer = getattr(client, "aclose", None) or getattr(client, "close", None)
+        if closer is not None:
+            try:
+                await closer()
+            except Exception as exc:
+                logger.warning("Error closing %s: %s", type(client).__name__, exc)
+        factory.cache_clear()
+
+
+async def warm_clients() -> None:
+    """Open a pooled connection to each HTTP upstream that is configured.
+
+    The response is irrelevant; any error (including a missing API key) is
+    logged and ignored.
+    """
+
+    async def warm(factory) -> None:
+        try:
+            await factory()._get_client().head("/", timeout=_WARM_TIMEOUT)
+        except Exception as exc:
+            logger.debug("Skipped warming %s: %s", factory.__name__, exc)
+
+    await asyncio.gather(*(warm(f) for f in _WARM_FACTORIES))
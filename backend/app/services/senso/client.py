@@ -5,9 +5,23 @@ Senso provides two core systems:
 - Context OS SDK (sdk.senso.ai): Manage brand knowledge, content generation, and rules engine.
 """
 import httpx
-from typing import Any, Optional, List, Dict
+from typing import Any, Optional, Dict
 
 from app.config import settings
+from app.services.cache import AsyncTTLCache, make_key
+from app.services.limiter import AdaptiveLimiter, with_adaptive_retry
+
+# Evaluations are a pure function of (brand, network, query) over short
+# windows; batch scans often repeat the same claim text.
+_evaluate_cache = AsyncTTLCache(
+    maxsize=settings.SENSO_CACHE_MAX_ENTRIES, ttl=settings.SENSO_CACHE_TTL
+)
+
+_evaluate_limiter = AdaptiveLimiter("senso.evaluate")
+
+_TIMEOUT = httpx.Timeout(30.0)
+_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
 
 class SensoGEOClient:
     """GEO Platform API — configurable via SENSO_API_BASE_URL or falls back to apiv2.senso.ai."""
@@ -20,41 +34,69 @@ class SensoGEOClient:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
+        self._client: httpx.AsyncClient | None = None
 
-    async def evaluate(self, query: str, brand: str, network: str) -> dict:
-        """Evaluate content against brand guidelines using Senso GEO."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/evaluate",
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP/2 client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
                 headers=self.headers,
-                json={
-                    "query": query,
-                    "brand": brand,
-                    "network": network
-                }
+                timeout=_TIMEOUT,
+                limits=_LIMITS,
+                http2=True,
             )
-            response.raise_for_status()
-            return response.json()
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def evaluate(self, query: str, brand: str, network: str) -> dict:
+        """Evaluate content against brand guidelines using Senso GEO.
+
+        Results are memoized for SENSO_CACHE_TTL seconds.
+        """
+        cache_key = make_key(brand, network, query)
+        cached = await _evaluate_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = await self._post_evaluate(query, brand, network)
+        await _evaluate_cache.set(cache_key, result)
+        return result
+
+    @with_adaptive_retry(_evaluate_limiter)
+    async def _post_evaluate(self, query: str, brand: str, network: str) -> dict:
+        response = await self._get_client().post(
+            "/evaluate",
+            json={
+                "query": query,
+                "brand": brand,
+                "network": network
+            }
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def remediate(self, context: str, optimize_for: str, target_networks: list) -> dict:
         """Generate correction strategy using Senso GEO."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/remediate",
-                headers=self.headers,
-                json={
-                    "context": context,
-                    "optimize_for": optimize_for,
-                    "target_networks": target_networks
-                }
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_client().post(
+            "/remediate",
+            json={
+                "context": context,
+                "optimize_for": optimize_for,
+                "target_networks": target_networks
+            }
+        )
+        response.raise_for_status()
+        return response.json()
 
 
 class SensoSDKClient:
     """Context OS SDK API (sdk.senso.ai)"""
-    
+
     def __init__(self):
         self.api_key = settings.SENSO_SDK_API_KEY
         self.base_url = "https://sdk.senso.ai/api/v1"
@@ -62,34 +104,48 @@ class SensoSDKClient:
             "X-API-Key": self.api_key,
             "Content-Type": "application/json",
         }
+        self._client: httpx.AsyncClient | None = None
 
-    async def ingest_content(self, title: str, summary: str, text: str) -> dict:
-        """Ingest brand ground truth into Senso SDK."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/content/raw",
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP/2 client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
                 headers=self.headers,
-                json={
-                    "title": title,
-                    "summary": summary,
-                    "text": text,
-                }
+                timeout=_TIMEOUT,
+                limits=_LIMITS,
+                http2=True,
             )
-            response.raise_for_status()
-            return response.json()
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def ingest_content(self, title: str, summary: str, text: str) -> dict:
+        """Ingest brand ground truth into Senso SDK."""
+        response = await self._get_client().post(
+            "/content/raw",
+            json={
+                "title": title,
+                "summary": summary,
+                "text": text,
+            }
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def search(self, query: str) -> dict:
         """Search brand knowledge base."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/search",
-                headers=self.headers,
-                json={
-                    "query": query
-                }
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_client().post(
+            "/search",
+            json={
+                "query": query
+            }
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def generate(self, prompt: str, template_id: Optional[str] = None) -> dict:
         """Generate brand-compliant content using Context OS SDK."""
@@ -97,39 +153,42 @@ class SensoSDKClient:
         if template_id:
             payload["template_id"] = template_id
             
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/generate",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_client().post(
+            "/generate",
+            json=payload
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def create_rule(self, name: str, conditions: dict) -> dict:
         """Set up automated misrepresentation detection rule."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/rules",
-                headers=self.headers,
-                json={
-                    "name": name,
-                    "conditions": conditions
-                }
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_client().post(
+            "/rules",
+            json={
+                "name": name,
+                "conditions": conditions
+            }
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def create_trigger(self, rule_id: str, webhook_url: str) -> dict:
         """Create a trigger linking rule to webhook."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/triggers",
-                headers=self.headers,
-                json={
-                    "rule_id": rule_id,
-                    "webhook_url": webhook_url
-                }
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_client().post(
+            "/triggers",
+            json={
+                "rule_id": rule_id,
+                "webhook_url": webhook_url
+            }
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def create_rule_with_trigger(self, name: str, conditions: dict, webhook_url: str) -> dict:
+        """Create a rule and its webhook trigger back to back on the pooled connection."""
+        rule = await self.create_rule(name, conditions)
+        rule_id = rule.get("id")
+        if not rule_id:
+            raise ValueError(f"Senso did not return an id for rule '{name}': {rule}")
+        trigger = await self.create_trigger(rule_id, webhook_url)
+        return {"rule": rule, "trigger": trigger}
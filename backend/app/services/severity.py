@@ -0,0 +1,17 @@
+"""Severity labels for 0-100 accuracy scores.
+
+Shared by the agent pipeline and scout mention ingestion so a score maps
+to the same label whichever path stored it.
+"""
+from bisect import bisect_right
+
+# Accuracy (percent) below each threshold maps to the label at that index
+SEVERITY_THRESHOLDS_PCT = (40, 60, 80)
+SEVERITY_LABELS = ("critical", "high", "medium", "low")
+
+
+def severity_for_score(
+    accuracy_pct: float, thresholds: tuple[int, ...] = SEVERITY_THRESHOLDS_PCT
+) -> str:
+    """Map a 0-100 accuracy score to a severity label (lower is worse)."""
+    return SEVERITY_LABELS[bisect_right(thresholds, accuracy_pct)]
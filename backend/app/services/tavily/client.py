@@ -10,12 +10,35 @@ import httpx
 import logging
 from typing import Any, Optional
 
+import orjson
+
 from app.config import settings
+from app.services.cache import AsyncTTLCache, make_key
+from app.services.limiter import AdaptiveLimiter, is_http_transient, with_adaptive_retry
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_TIMEOUT = 60.0
 _CRAWL_TIMEOUT = 180.0
+_EXTRACT_MAX_URLS = 20
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30)
+
+# Shared by every endpoint: at most 32 calls in flight, halved on 429/503,
+# and no more than TAVILY_RPM_LIMIT started per minute.
+_tavily_limiter = AdaptiveLimiter(
+    "tavily", max_limit=32, max_per_minute=settings.TAVILY_RPM_LIMIT or None
+)
+
+# Search and extract are pure functions of their payload over short windows;
+# the cron monitor and claim analysis often repeat the same query.
+_response_cache = AsyncTTLCache(
+    maxsize=settings.TAVILY_CACHE_MAX_ENTRIES, ttl=settings.TAVILY_CACHE_TTL
+)
+
+
+def _payload(required: dict[str, Any], **optional: Any) -> dict[str, Any]:
+    """Request body: every ``required`` field plus the ``optional`` ones that are set."""
+    return required | {k: v for k, v in optional.items() if v}
 
 
 class TavilyClient:
@@ -28,22 +51,68 @@ class TavilyClient:
             raise ValueError(
                 "Tavily API key is required. Set TAVILY_API_KEY in .env"
             )
-
-    def _headers(self) -> dict[str, str]:
-        return {
+        self.headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}",
         }
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP/2 client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=_DEFAULT_TIMEOUT,
+                limits=_LIMITS,
+                http2=True,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "TavilyClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
     async def _post(
-        self, endpoint: str, payload: dict[str, Any], timeout: float = _DEFAULT_TIMEOUT
+        self,
+        endpoint: str,
+        payload: dict[str, Any],
+        timeout: float = _DEFAULT_TIMEOUT,
+        cache: bool = False,
     ) -> dict[str, Any]:
-        """Send a POST request to Tavily and return the JSON response."""
-        url = f"{self.base_url}/{endpoint}"
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(url, json=payload, headers=self._headers())
-            response.raise_for_status()
-            return response.json()
+        """Send a POST request to Tavily and return the JSON response.
+
+        With ``cache=True`` identical payloads are answered from memory for
+        TAVILY_CACHE_TTL seconds without taking a rate-limit slot.
+        """
+        if not cache:
+            return await self._send(endpoint, payload, timeout)
+        cache_key = make_key(endpoint, orjson.dumps(payload, option=orjson.OPT_SORT_KEYS))
+        cached = await _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        result = await self._send(endpoint, payload, timeout)
+        await _response_cache.set(cache_key, result)
+        return result
+
+    @with_adaptive_retry(_tavily_limiter, retries=4, is_transient=is_http_transient)
+    async def _send(
+        self, endpoint: str, payload: dict[str, Any], timeout: float
+    ) -> dict[str, Any]:
+        # Extract/crawl bodies can be megabytes of markdown; orjson parses
+        # them several times faster than the stdlib.
+        response = await self._get_client().post(
+            f"/{endpoint}", content=orjson.dumps(payload), timeout=timeout
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     # ── Search API ──────────────────────────────────────────────
 
@@ -79,23 +148,22 @@ class TavilyClient:
         if not query or not query.strip():
             raise ValueError("Search query cannot be empty")
 
-        payload: dict[str, Any] = {
-            "query": query,
-            "topic": topic,
-            "search_depth": search_depth,
-            "max_results": max_results,
-            "include_answer": include_answer,
-            "include_raw_content": include_raw_content,
-        }
-        if time_range:
-            payload["time_range"] = time_range
-        if include_domains:
-            payload["include_domains"] = include_domains
-        if exclude_domains:
-            payload["exclude_domains"] = exclude_domains
+        payload = _payload(
+            {
+                "query": query,
+                "topic": topic,
+                "search_depth": search_depth,
+                "max_results": max_results,
+                "include_answer": include_answer,
+                "include_raw_content": include_raw_content,
+            },
+            time_range=time_range,
+            include_domains=include_domains,
+            exclude_domains=exclude_domains,
+        )
 
         logger.info("Tavily search: query=%r topic=%s depth=%s", query, topic, search_depth)
-        return await self._post("search", payload)
+        return await self._post("search", payload, cache=True)
 
     # ── Extract API ─────────────────────────────────────────────
 
@@ -120,19 +188,16 @@ class TavilyClient:
         """
         if not urls:
             raise ValueError("At least one URL is required for extraction")
-        if len(urls) > 20:
+        if len(urls) > _EXTRACT_MAX_URLS:
             raise ValueError("Tavily extract supports at most 20 URLs per request")
 
-        payload: dict[str, Any] = {
-            "urls": urls,
-            "extract_depth": extract_depth,
-            "format": format,
-        }
-        if query:
-            payload["query"] = query
+        payload = _payload(
+            {"urls": urls, "extract_depth": extract_depth, "format": format},
+            query=query,
+        )
 
         logger.info("Tavily extract: %d URLs, depth=%s", len(urls), extract_depth)
-        return await self._post("extract", payload)
+        return await self._post("extract", payload, cache=True)
 
     # ── Map API ─────────────────────────────────────────────────
 
@@ -155,13 +220,10 @@ class TavilyClient:
         Returns:
             Dict with "results" (list of discovered URLs).
         """
-        payload: dict[str, Any] = {
-            "url": url,
-            "max_depth": max_depth,
-            "limit": limit,
-        }
-        if instructions:
-            payload["instructions"] = instructions
+        payload = _payload(
+            {"url": url, "max_depth": max_depth, "limit": limit},
+            instructions=instructions,
+        )
 
         logger.info("Tavily map: url=%r depth=%d limit=%d", url, max_depth, limit)
         return await self._post("map", payload, timeout=_CRAWL_TIMEOUT)
@@ -191,15 +253,16 @@ class TavilyClient:
         Returns:
             Dict with "results" containing extracted content per page.
         """
-        payload: dict[str, Any] = {
-            "url": url,
-            "max_depth": max_depth,
-            "limit": limit,
-            "extract_depth": extract_depth,
-            "format": format,
-        }
-        if instructions:
-            payload["instructions"] = instructions
+        payload = _payload(
+            {
+                "url": url,
+                "max_depth": max_depth,
+                "limit": limit,
+                "extract_depth": extract_depth,
+                "format": format,
+            },
+            instructions=instructions,
+        )
 
         logger.info("Tavily crawl: url=%r depth=%d limit=%d", url, max_depth, limit)
         return await self._post("crawl", payload, timeout=_CRAWL_TIMEOUT)
@@ -207,15 +270,22 @@ class TavilyClient:
 
 # ── Helper: Source Analyzer ─────────────────────────────────────
 
-async def analyze_claim_sources(claim: str, brand: str) -> dict[str, Any]:
+async def analyze_claim_sources(
+    claim: str, brand: str, client: TavilyClient | None = None
+) -> dict[str, Any]:
     """Investigate a claim by searching the web and extracting source content.
 
     Workflow:
       1. Search the web for the claim + brand name
       2. Extract full content from the top results
       3. Return sources with their content and relevance scores
+
+    Pass a long-lived ``client`` to reuse its connection pool; otherwise a
+    temporary one is created and closed afterwards.
     """
-    client = TavilyClient()
+    if client is None:
+        async with TavilyClient() as owned:
+            return await analyze_claim_sources(claim, brand, owned)
 
     search_results = await client.search(
         query=f"{brand} {claim}",
@@ -225,28 +295,33 @@ async def analyze_claim_sources(claim: str, brand: str) -> dict[str, Any]:
         include_answer=True,
     )
 
-    source_urls = [r["url"] for r in search_results.get("results", [])]
+    search_hits = search_results.get("results", [])
+    source_urls = [hit["url"] for hit in search_hits]
 
+    # Search returns at most 10 hits, well under extract's 20-URL limit,
+    # so one extract call covers them all. Errors propagate to the caller.
     extracted = {"results": [], "failed_results": []}
     if source_urls:
         extracted = await client.extract(
-            urls=source_urls[:20],
+            urls=source_urls[:_EXTRACT_MAX_URLS],
             query=f"What claims does this source make about {brand}?",
             extract_depth="basic",
         )
 
-    search_hits = search_results.get("results", [])
-    extracted_map = {r["url"]: r.get("raw_content", "") for r in extracted.get("results", [])}
+    raw_content_for = {
+        r["url"]: r.get("raw_content", "") for r in extracted.get("results", [])
+    }.get
 
-    sources = []
-    for hit in search_hits:
-        sources.append({
-            "url": hit["url"],
+    sources = [
+        {
+            "url": (url := hit["url"]),
             "title": hit.get("title", ""),
             "snippet": hit.get("content", ""),
             "score": hit.get("score", 0),
-            "raw_content": extracted_map.get(hit["url"], ""),
-        })
+            "raw_content": raw_content_for(url, ""),
+        }
+        for hit in search_hits
+    ]
 
     return {
         "claim": claim,
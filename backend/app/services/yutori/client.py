@@ -7,18 +7,31 @@ Three APIs power BrandGuard's monitoring system:
 """
 import asyncio
 import logging
+import random
 import time
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 import httpx
+import orjson
 
 from app.config import settings
+from app.services.limiter import AdaptiveLimiter, is_http_transient, with_adaptive_retry
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_TIMEOUT = 30.0
 _POLL_TIMEOUT = 600
-_POLL_INTERVAL = 5
+# Polls back off 1s -> 2s -> 4s ... up to 15s, with +/-20% jitter so many
+# concurrent pollers don't hit the API in lockstep.
+_POLL_INTERVAL = 1.0
+_POLL_MAX_INTERVAL = 15.0
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30)
+
+# At most 32 calls in flight, halved on 429/503, and no more than
+# YUTORI_RPM_LIMIT started per minute (cron fans out across every scout).
+_yutori_limiter = AdaptiveLimiter(
+    "yutori", max_limit=32, max_per_minute=settings.YUTORI_RPM_LIMIT or None
+)
 
 BRAND_MENTION_SCHEMA = {
     "type": "object",
@@ -67,6 +80,8 @@ PLATFORM_URLS = {
 # Platforms that work without login (preferred for browsing tasks)
 NO_AUTH_PLATFORMS = {"perplexity"}
 
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
 
 class YutoriClient:
     """Async client for Yutori Scouting, Browsing, and Research APIs."""
@@ -76,12 +91,34 @@ class YutoriClient:
         self.base_url = "https://api.yutori.com"
         if not self.api_key:
             raise ValueError("Yutori API key is required. Set YUTORI_API_KEY in .env")
-
-    def _headers(self) -> dict[str, str]:
-        return {
+        self.headers = {
             "Content-Type": "application/json",
             "X-API-Key": self.api_key,
         }
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP/2 client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=_DEFAULT_TIMEOUT,
+                limits=_LIMITS,
+                http2=True,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "YutoriClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
     async def _request(
         self,
@@ -90,15 +127,34 @@ class YutoriClient:
         payload: dict[str, Any] | None = None,
         timeout: float = _DEFAULT_TIMEOUT,
     ) -> dict[str, Any]:
-        url = f"{self.base_url}{path}"
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.request(
-                method, url, json=payload, headers=self._headers()
-            )
-            response.raise_for_status()
-            if response.status_code == 204:
-                return {"status": "ok"}
-            return response.json()
+        send = self._send_idempotent if method in _IDEMPOTENT_METHODS else self._send_once
+        return await send(method, path, payload, timeout)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        payload: dict[str, Any] | None,
+        timeout: float,
+    ) -> dict[str, Any]:
+        response = await self._get_client().request(
+            method,
+            path,
+            content=orjson.dumps(payload) if payload is not None else None,
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        if response.status_code == 204:
+            return {"status": "ok"}
+        return orjson.loads(response.content)
+
+    # A 429/503 means the call was refused, so any method may retry it. A
+    # dropped connection or 5xx may have landed, so only idempotent methods
+    # retry those; a repeated POST could create a second scout or task.
+    _send_once = with_adaptive_retry(_yutori_limiter, retries=4)(_send)
+    _send_idempotent = with_adaptive_retry(
+        _yutori_limiter, retries=4, is_transient=is_http_transient
+    )(_send)
 
     # ═══════════════════════════════════════════════════════════
     #  Scouting API
@@ -143,7 +199,7 @@ class YutoriClient:
         return await self._request("POST", "/v1/scouting/tasks", payload)
 
     async def list_scouts(self) -> list[dict[str, Any]]:
-        """List all scouts."""
+        """List all scouts, whichever shape the API wraps them in."""
         data = await self._request("GET", "/v1/scouting/tasks")
         if isinstance(data, list):
             return data
@@ -222,17 +278,13 @@ class YutoriClient:
         return await self._request("GET", f"/v1/browsing/tasks/{task_id}/trajectory")
 
     async def poll_browse_result(
-        self, task_id: str, timeout: int = _POLL_TIMEOUT, interval: int = _POLL_INTERVAL
+        self, task_id: str, timeout: int = _POLL_TIMEOUT, interval: float = _POLL_INTERVAL
     ) -> dict[str, Any]:
         """Poll until a browsing task completes or times out."""
-        start = time.monotonic()
-        while time.monotonic() - start < timeout:
-            result = await self.get_browse_result(task_id)
-            status = result.get("status", "")
-            if status in ("succeeded", "failed"):
-                return result
-            await asyncio.sleep(interval)
-        raise TimeoutError(f"Browsing task {task_id} did not complete within {timeout}s")
+        result = await _poll(self.get_browse_result, task_id, timeout, interval)
+        if result is None:
+            raise TimeoutError(f"Browsing task {task_id} did not complete within {timeout}s")
+        return result
 
     # ═══════════════════════════════════════════════════════════
     #  Research API
@@ -267,14 +319,39 @@ class YutoriClient:
         return await self._request("GET", f"/v1/research/tasks/{task_id}")
 
     async def poll_research_result(
-        self, task_id: str, timeout: int = _POLL_TIMEOUT, interval: int = _POLL_INTERVAL
+        self, task_id: str, timeout: int = _POLL_TIMEOUT, interval: float = _POLL_INTERVAL
     ) -> dict[str, Any]:
         """Poll until a research task completes or times out."""
-        start = time.monotonic()
-        while time.monotonic() - start < timeout:
-            result = await self.get_research_result(task_id)
-            status = result.get("status", "")
-            if status in ("succeeded", "failed"):
-                return result
-            await asyncio.sleep(interval)
-        raise TimeoutError(f"Research task {task_id} did not complete within {timeout}s")
+        result = await _poll(self.get_research_result, task_id, timeout, interval)
+        if result is None:
+            raise TimeoutError(f"Research task {task_id} did not complete within {timeout}s")
+        return result
+
+
+async def _poll(
+    fetch: Callable[[str], Awaitable[dict[str, Any]]],
+    task_id: str,
+    timeout: float,
+    interval: float,
+) -> Optional[dict[str, Any]]:
+    """Fetch a task until it finishes, backing off between attempts.
+
+    Honors an ``estimated_completion_in`` hint (seconds) when the API sends
+    one. Returns None if the task is still running after ``timeout``.
+    """
+    deadline = time.monotonic() + timeout
+    delay = interval
+    while True:
+        result = await fetch(task_id)
+        if result.get("status", "") in ("succeeded", "failed"):
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        eta = result.get("estimated_completion_in")
+        if isinstance(eta, (int, float)) and eta > 0:
+            wait = float(eta)
+        else:
+            wait = delay * random.uniform(0.8, 1.2)
+            delay = min(_POLL_MAX_INTERVAL, delay * 2)
+        await asyncio.sleep(min(wait, remaining))
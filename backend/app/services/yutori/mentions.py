@@ -0,0 +1,103 @@
+"""Shape Yutori scout output into mention dicts for the Neo4j client.
+
+Used by the scout webhooks and the cron monitor so both store the same
+rows. ``graph_mention`` returns ``None`` for items that can't be
+stored (no brand or no claim text) so a bulk write never receives a
+malformed row.
+"""
+from typing import Any, Optional
+
+from app.services.severity import severity_for_score
+
+# Representative accuracy for a scout's own severity label
+_SEVERITY_SCORES = {"critical": 10, "high": 30, "medium": 55, "low": 80}
+
+
+def severity_score(severity: str) -> float:
+    return _SEVERITY_SCORES.get(severity, 50)
+
+
+def evaluation_score(evaluation: Any) -> Optional[float]:
+    """Accuracy score from a Senso evaluate response, if it carries one."""
+    if not isinstance(evaluation, dict):
+        return None
+    score = evaluation.get("accuracy_score", evaluation.get("score"))
+    try:
+        return float(score) if score is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def update_id(update: dict) -> Optional[str]:
+    """Id of a scout update (webhook body or polled entry), if it has one.
+
+    An ``id`` equal to the scout's own id names the task rather than the
+    update, so it can't tell two deliveries apart and is ignored.
+    """
+    uid = update.get("update_id") or update.get("id")
+    if not uid or uid in (update.get("scout_id"), update.get("task_id")):
+        return None
+    return str(uid)
+
+
+def scout_mentions(update: dict) -> list[tuple[Optional[str], dict]]:
+    """Mention items in a scout update, each with the id to store it under.
+
+    Updates with a structured result yield their ``brand_mentions``
+    entries, ids ``"<update id>:<index>"``; otherwise the update's raw text
+    is a single item whose id is the update id. Ids are None when the
+    update has none. The webhook and the cron both go through here so a
+    delivery and a poll of the same update produce the same rows.
+    """
+    uid = update_id(update)
+    structured = update.get("structured_result") or update.get("result")
+    if isinstance(structured, dict):
+        return [
+            (f"{uid}:{i}" if uid else None, m)
+            for i, m in enumerate(structured.get("brand_mentions") or [])
+            if isinstance(m, dict) and m.get("claim")
+        ]
+    text = update.get("content") or (structured if isinstance(structured, str) else None)
+    return [(uid, {"claim": text})] if text else []
+
+
+def graph_mention(
+    item: dict,
+    brand_info: dict,
+    accuracy_score: Optional[float] = None,
+    mention_id: Optional[str] = None,
+) -> Optional[dict]:
+    """Build a ``store_mention`` dict from a scout mention or update.
+
+    ``item`` is either a structured ``brand_mentions`` entry (``claim``,
+    ``severity``, ``accuracy``, ...) or a raw scout update (``content``).
+    A Senso ``accuracy_score`` overrides the scout's own severity/accuracy
+    labels. ``mention_id`` should be derived from the scout update id so a
+    redelivered update maps onto the mention already stored. Returns
+    ``None`` when the brand or claim text is missing.
+    """
+    claim = item.get("claim") or item.get("content")
+    if not claim or not brand_info.get("brand_id"):
+        return None
+
+    if accuracy_score is not None:
+        score = accuracy_score
+        severity = severity_for_score(score)
+    else:
+        severity = item.get("severity", "medium")
+        score = severity_score(severity)
+        if item.get("accuracy") == "accurate":
+            score = max(score, 80)
+        elif item.get("accuracy") == "inaccurate":
+            score = min(score, 40)
+
+    return {
+        "id": mention_id,
+        "brand_id": brand_info["brand_id"],
+        "brand_name": brand_info.get("brand_name") or brand_info["brand_id"],
+        "platform": item.get("platform") or "unknown",
+        "claim": claim,
+        "accuracy_score": score,
+        "severity": severity,
+        "source_urls": [item["source_url"]] if item.get("source_url") else [],
+    }
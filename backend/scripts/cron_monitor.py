@@ -3,8 +3,9 @@ BrandGuard Cron Monitor
 
 Runs every 6 hours via Render cron job.
 1. Gets all active scouts from Yutori
-2. Polls each scout for new updates
+2. Polls each scout for updates since its last stored one
 3. Processes any new mentions through the evaluation pipeline
+4. Stores them and advances each scout's cursor
 """
 import asyncio
 import sys
@@ -14,80 +15,171 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from app.config import settings
-from app.services.yutori.client import YutoriService
-from app.services.senso.client import SensoService
-from app.services.neo4j.client import Neo4jService
+from app.services.yutori import YutoriClient
+from app.services.yutori.mentions import evaluation_score, graph_mention, scout_mentions
+from app.services.senso import SensoGEOClient
+from app.services.neo4j import Neo4jClient, get_neo4j_client
 
 import structlog
 
 log = structlog.get_logger()
 
+# Scouts polled at once; the Yutori client's own limiter still applies
+POLL_CONCURRENCY = 16
+# Update pages read per scout per run when catching up on a backlog
+MAX_UPDATE_PAGES = 5
+# Senso evaluations in flight at once
+EVAL_CONCURRENCY = 8
+
+
+async def fetch_new_updates(
+    yutori: YutoriClient, scout_id: str, since: str | None
+) -> list[dict]:
+    """Updates for one scout created after ``since``, newest first.
+
+    Pages back through the feed with its cursor until a page reaches
+    ``since``, at most MAX_UPDATE_PAGES pages. With no ``since`` (first
+    poll) only the latest page is read.
+    """
+    updates = []
+    cursor = None
+    for _ in range(MAX_UPDATE_PAGES if since else 1):
+        page = await yutori.get_scout_updates(scout_id, cursor=cursor)
+        entries = page.get("updates", [])
+        fresh = [e for e in entries if not since or (e.get("created_at") or "") > since]
+        updates.extend(fresh)
+        cursor = page.get("next_cursor")
+        if not cursor or len(fresh) < len(entries):
+            break
+    return updates
+
 
-async def poll_scouts(yutori: YutoriService) -> list[dict]:
-    """Fetch all active scouts and collect their latest updates."""
+async def poll_scouts(yutori: YutoriClient, neo4j: Neo4jClient) -> list[dict]:
+    """Fetch all active scouts and collect their updates since the last run.
+
+    Each update is tagged with its ``scout_id`` and the ``brand_id``/
+    ``brand_name`` its scout was linked to when /api/monitoring/start
+    created it; scouts with no link are skipped.
+    """
     try:
-        scouts_response = await yutori.list_scouts()
-        scouts = scouts_response.get("tasks", [])
+        # list_scouts normalizes every response shape to a list
+        scouts = await yutori.list_scouts()
         log.info("fetched_scouts", count=len(scouts))
-    except NotImplementedError:
-        log.warning("yutori_not_implemented", msg="Yutori list_scouts not yet implemented, skipping")
-        return []
+        linked = await neo4j.get_scout_brands()
     except Exception as e:
         log.error("fetch_scouts_failed", error=str(e))
         return []
 
-    all_updates = []
+    sem = asyncio.Semaphore(POLL_CONCURRENCY)
+
+    async def fetch(scout_id: str) -> list[dict]:
+        async with sem:
+            return await fetch_new_updates(yutori, scout_id, linked[scout_id]["last_seen"])
+
+    scout_ids = []
     for scout in scouts:
-        scout_id = scout.get("id")
-        if not scout_id:
+        if not scout.get("id"):
             continue
-        try:
-            updates = await yutori.get_scout_updates(scout_id)
-            entries = updates.get("updates", [])
-            log.info("scout_updates", scout_id=scout_id, count=len(entries))
-            all_updates.extend(entries)
-        except NotImplementedError:
-            log.warning("get_updates_not_implemented", scout_id=scout_id)
-        except Exception as e:
-            log.error("scout_poll_failed", scout_id=scout_id, error=str(e))
-
-    return all_updates
+        if scout["id"] not in linked:
+            log.warning("scout_brand_unknown", scout_id=scout["id"])
+            continue
+        scout_ids.append(scout["id"])
 
+    responses = await asyncio.gather(
+        *(fetch(scout_id) for scout_id in scout_ids), return_exceptions=True
+    )
 
-async def evaluate_mentions(senso: SensoService, mentions: list[dict]) -> list[dict]:
-    """Run each mention through Senso content evaluation."""
-    results = []
-    for mention in mentions:
-        content = mention.get("content", "")
-        if not content:
+    all_updates = []
+    for scout_id, updates in zip(scout_ids, responses):
+        if isinstance(updates, Exception):
+            log.error("scout_poll_failed", scout_id=scout_id, error=str(updates))
             continue
-        try:
-            evaluation = await senso.evaluate_content(content)
-            results.append({**mention, "evaluation": evaluation})
-            log.info("evaluated_mention", mention_id=mention.get("id"))
-        except NotImplementedError:
-            log.warning("senso_not_implemented", msg="Senso evaluate_content not yet implemented, skipping")
-            break
-        except Exception as e:
-            log.error("evaluation_failed", mention_id=mention.get("id"), error=str(e))
-
-    return results
+        log.info("scout_updates", scout_id=scout_id, count=len(updates))
+        brand = {
+            "scout_id": scout_id,
+            "brand_id": linked[scout_id]["brand_id"],
+            "brand_name": linked[scout_id]["brand_name"],
+        }
+        all_updates.extend({**update, **brand} for update in updates)
 
+    return all_updates
 
-async def store_results(neo4j: Neo4jService, evaluated: list[dict]) -> int:
-    """Persist evaluated mentions to the knowledge graph."""
-    stored = 0
-    for item in evaluated:
-        try:
-            await neo4j.store_mention(item)
-            stored += 1
-        except NotImplementedError:
-            log.warning("neo4j_not_implemented", msg="Neo4j store_mention not yet implemented, skipping")
-            break
-        except Exception as e:
-            log.error("store_failed", error=str(e))
 
-    return stored
+def collect_mentions(updates: list[dict]) -> list[dict]:
+    """Split updates into mention items, as the scout webhook does.
+
+    Each item carries its update's brand and the ``mention_id`` it is
+    stored under.
+    """
+    mentions = []
+    for update in updates:
+        brand = {"brand_id": update["brand_id"], "brand_name": update["brand_name"]}
+        for mention_id, item in scout_mentions(update):
+            mentions.append({**item, **brand, "mention_id": mention_id})
+    return mentions
+
+
+def latest_seen(updates: list[dict]) -> dict[str, str]:
+    """Newest update timestamp per scout, to poll from next run."""
+    cursors: dict[str, str] = {}
+    for update in updates:
+        created_at = update.get("created_at")
+        if created_at and created_at > cursors.get(update["scout_id"], ""):
+            cursors[update["scout_id"]] = created_at
+    return cursors
+
+
+async def evaluate_mentions(senso: SensoGEOClient, mentions: list[dict]) -> list[dict]:
+    """Run each mention through Senso GEO evaluation, EVAL_CONCURRENCY at a time.
+
+    A mention whose evaluation fails is kept without one, so it is still
+    stored, scored from the scout's own labels.
+    """
+    sem = asyncio.Semaphore(EVAL_CONCURRENCY)
+
+    async def evaluate_one(mention: dict) -> dict:
+        async with sem:
+            try:
+                evaluation = await senso.evaluate(
+                    query=mention["claim"],
+                    brand=mention.get("brand_name") or mention["brand_id"],
+                    network=mention.get("platform") or "web",
+                )
+            except Exception as e:
+                log.error("evaluation_failed", mention_id=mention["mention_id"], error=str(e))
+                return mention
+        log.info("evaluated_mention", mention_id=mention["mention_id"])
+        return {**mention, "evaluation": evaluation}
+
+    return list(await asyncio.gather(*(evaluate_one(m) for m in mentions)))
+
+
+async def store_results(neo4j: Neo4jClient, evaluated: list[dict]) -> int | None:
+    """Persist evaluated mentions to the knowledge graph in one UNWIND write.
+
+    Mentions are reshaped for ``store_mention`` with the Senso score as
+    ``accuracy_score``. They are stored under ids derived from the update
+    id, so an update polled twice (or also delivered by webhook) is stored
+    once. Any that lack a brand or claim text are skipped so one bad row
+    can't fail the whole batch. Returns None if the write failed.
+    """
+    rows = []
+    for m in evaluated:
+        mention = graph_mention(
+            m, m, evaluation_score(m.get("evaluation")), m["mention_id"]
+        )
+        if mention is None:
+            log.warning("skipped_malformed_mention", mention_id=m["mention_id"])
+            continue
+        rows.append(mention)
+    if not rows:
+        return 0
+    try:
+        results = await neo4j.store_mentions_bulk(rows)
+    except Exception as e:
+        log.error("store_failed", count=len(rows), error=str(e))
+        return None
+    return len(results)
 
 
 async def main():
@@ -99,27 +191,45 @@ async def main():
     if missing:
         log.warning("missing_config", keys=missing)
 
-    # Initialize service clients
-    yutori = YutoriService()
-    senso = SensoService()
-    neo4j = Neo4jService()
-
-    # Step 1: Poll all active scouts for new mentions
-    mentions = await poll_scouts(yutori)
-    log.info("poll_complete", total_mentions=len(mentions))
-
-    if not mentions:
-        log.info("cron_complete", msg="No new mentions found")
+    # Initialize service clients; without Yutori there is nothing to poll
+    try:
+        yutori = YutoriClient()
+    except ValueError as e:
+        log.warning("yutori_not_configured", error=str(e))
         return
+    senso = SensoGEOClient()
+    neo4j = get_neo4j_client()
 
-    # Step 2: Evaluate mentions through Senso pipeline
-    evaluated = await evaluate_mentions(senso, mentions)
-    log.info("evaluation_complete", evaluated_count=len(evaluated))
-
-    # Step 3: Store results in knowledge graph
-    stored = await store_results(neo4j, evaluated)
-    log.info("cron_complete", mentions_found=len(mentions), evaluated=len(evaluated), stored=stored)
-
+    try:
+        # Step 1: Poll all active scouts for updates since the last run
+        updates = await poll_scouts(yutori, neo4j)
+        mentions = collect_mentions(updates)
+        log.info("poll_complete", total_updates=len(updates), total_mentions=len(mentions))
+
+        stored = 0
+        if mentions:
+            # Step 2: Evaluate mentions through Senso pipeline
+            evaluated = await evaluate_mentions(senso, mentions)
+            log.info("evaluation_complete", evaluated_count=len(evaluated))
+
+            # Step 3: Store results in knowledge graph
+            stored = await store_results(neo4j, evaluated)
+            if stored is None:
+                # Leave the cursors alone so the next run retries these updates
+                return
+
+        # Step 4: Remember how far each scout has been read
+        await neo4j.set_scout_cursors(latest_seen(updates))
+        log.info("cron_complete", mentions_found=len(mentions), stored=stored)
+    finally:
+        await yutori.aclose()
+        await senso.aclose()
+        await neo4j.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -49,6 +49,14 @@ SOURCES = [
     {"url": "https://trustpilot.com/review/acme-corp", "domain": "trustpilot.com"},
 ]
 
+# Fixed seed so every run produces the same demo scores, platforms and sources
+rng = random.Random(42)
+
+# Source URL pools the mention builder samples from; fixed, so split once
+DUBIOUS_URLS = [s["url"] for s in SOURCES[:4]]
+CREDIBLE_URLS = [s["url"] for s in SOURCES[4:]]
+ALL_URLS = [s["url"] for s in SOURCES]
+
 ACCURATE_CLAIMS = [
     "Acme Corp provides enterprise AI solutions for Fortune 500 companies.",
     "Acme Corp was founded in 2015 in San Francisco.",
@@ -94,94 +102,83 @@ CRITICAL_CLAIMS = [
 ]
 
 
-def _rand_date(days_back: int = 90) -> str:
-    dt = datetime.now(timezone.utc) - timedelta(
-        days=random.randint(0, days_back),
-        hours=random.randint(0, 23),
-        minutes=random.randint(0, 59),
-    )
-    return dt.isoformat()
+def _rand_date(now: datetime, days_back: int = 90) -> str:
+    """ISO timestamp a random number of seconds (up to ``days_back`` days) before ``now``."""
+    return (now - timedelta(seconds=rng.randint(0, days_back * 86400))).isoformat()
+
+
+# Severity for each whole-number score 0-100
+_SEVERITY_BY_SCORE = tuple(
+    "critical" if s < 40 else "high" if s < 60 else "medium" if s < 80 else "low"
+    for s in range(101)
+)
 
 
 def _severity_from_score(score: float) -> str:
-    if score >= 80:
-        return "low"
-    if score >= 60:
-        return "medium"
-    if score >= 40:
-        return "high"
-    return "critical"
+    return _SEVERITY_BY_SCORE[min(100, max(0, int(score)))]
 
 
 def _build_mentions() -> list[dict]:
     mentions = []
+    now = datetime.now(timezone.utc)
 
     for claim in ACCURATE_CLAIMS:
-        score = random.uniform(75, 98)
+        score = rng.uniform(75, 98)
         mentions.append({
             "id": str(uuid.uuid4()),
             "brand_id": BRAND["id"],
             "brand_name": BRAND["name"],
-            "platform": random.choice(PLATFORMS),
+            "platform": rng.choice(PLATFORMS),
             "claim": claim,
             "accuracy_score": round(score, 1),
             "severity": "low",
-            "detected_at": _rand_date(),
-            "source_urls": random.sample(
-                [s["url"] for s in SOURCES[4:]],  # credible sources
-                k=random.randint(1, 3),
-            ),
+            "detected_at": _rand_date(now),
+            "source_urls": rng.sample(CREDIBLE_URLS, k=rng.randint(1, 3)),
         })
 
     for claim in INACCURATE_CLAIMS:
-        score = random.uniform(10, 55)
+        score = rng.uniform(10, 55)
         mentions.append({
             "id": str(uuid.uuid4()),
             "brand_id": BRAND["id"],
             "brand_name": BRAND["name"],
-            "platform": random.choice(PLATFORMS),
+            "platform": rng.choice(PLATFORMS),
             "claim": claim,
             "accuracy_score": round(score, 1),
             "severity": _severity_from_score(score),
-            "detected_at": _rand_date(60),
-            "source_urls": random.sample(
-                [s["url"] for s in SOURCES[:4]],  # dubious sources
-                k=random.randint(1, 2),
-            ),
+            "detected_at": _rand_date(now, 60),
+            "source_urls": rng.sample(DUBIOUS_URLS, k=rng.randint(1, 2)),
         })
 
     for claim in CRITICAL_CLAIMS:
-        score = random.uniform(2, 20)
+        score = rng.uniform(2, 20)
         mentions.append({
             "id": str(uuid.uuid4()),
             "brand_id": BRAND["id"],
             "brand_name": BRAND["name"],
-            "platform": random.choice(PLATFORMS),
+            "platform": rng.choice(PLATFORMS),
             "claim": claim,
             "accuracy_score": round(score, 1),
             "severity": "critical",
-            "detected_at": _rand_date(14),
-            "source_urls": random.sample(
-                [s["url"] for s in SOURCES[:4]],
-                k=random.randint(1, 3),
-            ),
+            "detected_at": _rand_date(now, 14),
+            "source_urls": rng.sample(DUBIOUS_URLS, k=rng.randint(1, 3)),
         })
 
     # Pad to 50+ with extra accurate ones
-    while len(mentions) < 55:
-        claim = random.choice(ACCURATE_CLAIMS) + f" (ref {len(mentions)})"
-        score = random.uniform(70, 95)
-        mentions.append({
+    mentions.extend(
+        {
             "id": str(uuid.uuid4()),
             "brand_id": BRAND["id"],
             "brand_name": BRAND["name"],
-            "platform": random.choice(PLATFORMS),
-            "claim": claim,
-            "accuracy_score": round(score, 1),
+            "platform": rng.choice(PLATFORMS),
+            "claim": rng.choice(ACCURATE_CLAIMS) + f" (ref {i})",
+            "accuracy_score": round(rng.uniform(70, 95), 1),
             "severity": "low",
-            "detected_at": _rand_date(),
-            "source_urls": [random.choice([s["url"] for s in SOURCES])],
-        })
+            "detected_at": _rand_date(now),
+            "source_urls": [rng.choice(ALL_URLS)],
+        }
+        for i in range(len(mentions), 55)
+    )
 
     return mentions
 
@@ -199,12 +196,9 @@ async def seed():
 
     mentions = _build_mentions()
     print(f"Storing {len(mentions)} mentions …")
-    stored_ids = []
-    for i, m in enumerate(mentions, 1):
-        result = await client.store_mention(m)
-        stored_ids.append(m["id"])
-        if i % 10 == 0:
-            print(f"  {i}/{len(mentions)} stored")
+    # One UNWIND write instead of a transaction per mention
+    stored = await client.store_mentions_bulk(mentions)
+    print(f"  {len(stored)}/{len(mentions)} stored")
 
     # Pick 2 inaccurate mentions for corrections
     inaccurate_ids = [
@@ -225,8 +219,7 @@ async def seed():
         },
     ]
     print(f"Storing {len(corrections)} corrections …")
-    for c in corrections:
-        await client.store_correction(c)
+    await client.store_corrections_bulk(corrections)
 
     health = await client.get_brand_health(BRAND["id"])
     print("\n✓ Seed complete!")
@@ -64,28 +64,25 @@ async def main():
             }
         ]
         
-        for rule in rules:
-            try:
-                rule_res = await client.create_rule(
-                    name=rule["name"],
-                    conditions=rule["conditions"]
+        # Each rule's create + trigger is independent of the others; run them together
+        results = await asyncio.gather(
+            *(
+                client.create_rule_with_trigger(
+                    name=r["name"],
+                    conditions=r["conditions"],
+                    webhook_url="https://api.brandguard.com/api/webhooks/senso",
                 )
-                print(f"   Success creating rule '{rule['name']}': {rule_res}")
-                
-                # Create webhook trigger for the rule
-                rule_id = rule_res.get("id", "mock_rule_id")
-                try:
-                    trigger_res = await client.create_trigger(
-                        rule_id=rule_id,
-                        webhook_url="https://api.brandguard.com/api/webhooks/senso"
-                    )
-                    print(f"   Success creating trigger: {trigger_res}")
-                except Exception as e:
-                    print(f"   Failed to create trigger: {e}")
-                    
-            except Exception as e:
-                print(f"   Failed to create rule '{rule['name']}': {e}")
+                for r in rules
+            ),
+            return_exceptions=True,
+        )
+        for rule, result in zip(rules, results):
+            if isinstance(result, Exception):
+                print(f"   Failed to set up rule '{rule['name']}': {result}")
                 print("   (Continuing with mock mode...)")
+            else:
+                print(f"   Success creating rule '{rule['name']}': {result['rule']}")
+                print(f"   Success creating trigger: {result['trigger']}")
 
         # 4. Create prompts/templates for correction generation
         print("4. Creating prompts/templates for correction generation...")
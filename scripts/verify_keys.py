@@ -1,15 +1,30 @@
 import os
-import requests
-from dotenv import load_dotenv
+from enum import IntEnum
 
-def check_key(name: str, key_val: str, expected_prefix: str = "") -> str:
+def load_env_file(path: str) -> None:
+    """Load flat KEY=VALUE lines into os.environ without overriding set variables."""
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, _, value = line.partition("=")
+            os.environ.setdefault(key.strip(), value.strip().strip("\"'"))
+
+class KeyStatus(IntEnum):
+    OK = 0
+    UNUSUAL = 1
+    PLACEHOLDER = 2
+    MISSING = 3
+
+def check_key(name: str, key_val: str, expected_prefix: str = "") -> tuple[KeyStatus, str]:
     if not key_val:
-        return "❌ Missing"
+        return KeyStatus.MISSING, "❌ Missing"
     if key_val.startswith("placeholder_"):
-        return "⚠️ Placeholder (Requires real key for full functionality)"
+        return KeyStatus.PLACEHOLDER, "⚠️ Placeholder (Requires real key for full functionality)"
     if expected_prefix and not key_val.startswith(expected_prefix):
-        return f"❓ Unusual format (Expected prefix: {expected_prefix})"
-    return "✅ Present"
+        return KeyStatus.UNUSUAL, f"❓ Unusual format (Expected prefix: {expected_prefix})"
+    return KeyStatus.OK, "✅ Present"
 
 def main():
     print("===========================================")
@@ -22,7 +37,7 @@ def main():
         print("Please copy backend/.env.example to backend/.env and add your keys.")
         return
         
-    load_dotenv(env_path)
+    load_env_file(env_path)
     
     keys_to_check = [
         ("SENSO_GEO_API_KEY", ""),
@@ -37,9 +52,10 @@ def main():
     all_ready = True
     for key_name, expected_prefix in keys_to_check:
         val = os.getenv(key_name, "")
-        status = check_key(key_name, val, expected_prefix)
-        print(f"{key_name:<20}: {status}")
-        if "❌" in status or "⚠️" in status:
+        status, label = check_key(key_name, val, expected_prefix)
+        print(f"{key_name:<20}: {label}")
+        # An unusual prefix is only a hint; missing or placeholder keys block
+        if status >= KeyStatus.PLACEHOLDER:
             all_ready = False
             
     print("\n===========================================")
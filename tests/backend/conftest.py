@@ -0,0 +1,5 @@
+"""Make the backend ``app`` package importable from the repo-root tests."""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../backend")))
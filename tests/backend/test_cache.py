@@ -0,0 +1,70 @@
+"""Tests for the shared AsyncTTLCache."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import cache as cache_module
+from app.services.cache import AsyncTTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A monotonic clock the test advances by hand."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def test_entries_expire_after_ttl(clock):
+    async def run():
+        cache = AsyncTTLCache(maxsize=4, ttl=10)
+        await cache.set("a", 1)
+        clock.value += 9
+        assert await cache.get("a") == 1
+        clock.value += 2
+        assert await cache.get("a") is None
+
+    asyncio.run(run())
+
+
+def test_per_entry_ttl_and_zero_ttl(clock):
+    async def run():
+        cache = AsyncTTLCache(maxsize=4, ttl=10)
+        await cache.set("short", 1, ttl=1)
+        await cache.set("never", 2, ttl=0)
+        clock.value += 2
+        assert await cache.get("short") is None
+        assert await cache.get("never", "miss") == "miss"
+
+    asyncio.run(run())
+
+
+def test_least_recently_used_is_evicted(clock):
+    async def run():
+        cache = AsyncTTLCache(maxsize=2, ttl=60)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        assert await cache.get("a") == 1  # "b" is now least recently used
+        await cache.set("c", 3)
+        assert await cache.get("b") is None
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+
+    asyncio.run(run())
+
+
+def test_delete_prefix_only_drops_matching_keys(clock):
+    async def run():
+        cache = AsyncTTLCache(maxsize=8, ttl=60)
+        await cache.set("sources:acme:20", 1)
+        await cache.set("sources:acme:50", 2)
+        await cache.set("sources:acme-labs:20", 3)
+        await cache.set("health:acme", 4)
+        await cache.delete_prefix("sources:acme:")
+        assert await cache.get("sources:acme:20") is None
+        assert await cache.get("sources:acme:50") is None
+        assert await cache.get("sources:acme-labs:20") == 3
+        assert await cache.get("health:acme") == 4
+
+    asyncio.run(run())
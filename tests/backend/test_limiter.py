@@ -0,0 +1,124 @@
+"""Tests for the adaptive limiter and its retry decorator."""
+import asyncio
+
+import httpx
+import pytest
+
+from app.services import limiter as limiter_module
+from app.services.limiter import AdaptiveLimiter, with_adaptive_retry
+
+
+def _status_error(status: int, headers: dict | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://api.example.com/")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError(f"HTTP {status}", request=request, response=response)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping through them."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(limiter_module.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def test_overload_halves_limit():
+    async def run():
+        limiter = AdaptiveLimiter("test", initial=8, min_limit=3)
+        await limiter.acquire()
+        await limiter.release(succeeded=False, overloaded=True)
+        assert limiter.limit == 4
+        await limiter.acquire()
+        await limiter.release(succeeded=False, overloaded=True)
+        assert limiter.limit == 3  # floored at min_limit
+
+    asyncio.run(run())
+
+
+def test_successes_grow_limit_up_to_max():
+    async def run():
+        limiter = AdaptiveLimiter("test", initial=2, max_limit=3, increase_after=2)
+        for _ in range(6):
+            await limiter.acquire()
+            await limiter.release(succeeded=True)
+        assert limiter.limit == 3
+
+    asyncio.run(run())
+
+
+def test_overload_resets_success_streak():
+    async def run():
+        limiter = AdaptiveLimiter("test", initial=4, increase_after=2)
+        await limiter.acquire()
+        await limiter.release(succeeded=True)
+        await limiter.acquire()
+        await limiter.release(succeeded=False, overloaded=True)
+        await limiter.acquire()
+        await limiter.release(succeeded=True)
+        assert limiter.limit == 2
+
+    asyncio.run(run())
+
+
+def test_retry_honours_retry_after(sleeps):
+    limiter = AdaptiveLimiter("test", initial=8)
+    calls = 0
+
+    @with_adaptive_retry(limiter, base_delay=0.01)
+    async def flaky() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise _status_error(429, {"Retry-After": "7"})
+        return "ok"
+
+    assert asyncio.run(flaky()) == "ok"
+    assert calls == 2
+    assert sleeps == [pytest.approx(7.0)]
+    assert limiter.limit == 4
+
+
+def test_transient_errors_retry_without_shrinking(sleeps):
+    limiter = AdaptiveLimiter("test", initial=8)
+    calls = 0
+
+    @with_adaptive_retry(limiter, is_transient=limiter_module.is_http_transient)
+    async def flaky() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise _status_error(502)
+        return "ok"
+
+    assert asyncio.run(flaky()) == "ok"
+    assert len(sleeps) == 1
+    assert limiter.limit == 8
+
+
+def test_other_errors_are_not_retried(sleeps):
+    limiter = AdaptiveLimiter("test")
+
+    @with_adaptive_retry(limiter)
+    async def broken() -> None:
+        raise _status_error(404)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(broken())
+    assert sleeps == []
+    assert limiter._in_flight == 0
+
+
+def test_retries_give_up_after_limit(sleeps):
+    limiter = AdaptiveLimiter("test")
+
+    @with_adaptive_retry(limiter, retries=2)
+    async def overloaded() -> None:
+        raise _status_error(503)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(overloaded())
+    assert len(sleeps) == 2
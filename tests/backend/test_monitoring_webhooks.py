@@ -0,0 +1,126 @@
+"""Tests for the Yutori scout webhook and the shared scout mention shape."""
+import asyncio
+import hashlib
+import hmac
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import monitoring
+from app.config import settings
+from app.services.yutori.mentions import scout_mentions
+
+SECRET = "test-secret"
+PATH = "/webhooks/yutori/scout"
+
+
+def _sign(body: bytes) -> str:
+    return hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+
+
+@pytest.fixture
+def secret(monkeypatch):
+    monkeypatch.setattr(settings, "YUTORI_WEBHOOK_SECRET", SECRET)
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+    app.include_router(monitoring.router)
+    app.state.mention_queue = asyncio.Queue(maxsize=1)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return TestClient(app)
+
+
+# ── Signature checks ────────────────────────────────────────────
+
+def test_signature_not_required_without_secret(monkeypatch):
+    monkeypatch.setattr(settings, "YUTORI_WEBHOOK_SECRET", "")
+    assert monitoring._valid_signature(b"{}", None)
+
+
+@pytest.mark.parametrize("signature", [None, "", "deadbeef", "sha256=deadbeef"])
+def test_missing_or_wrong_signature_is_rejected(secret, signature):
+    assert not monitoring._valid_signature(b'{"a": 1}', signature)
+
+
+def test_signature_over_other_body_is_rejected(secret):
+    assert not monitoring._valid_signature(b'{"a": 2}', _sign(b'{"a": 1}'))
+
+
+@pytest.mark.parametrize("prefix", ["", "sha256="])
+def test_valid_signature_is_accepted(secret, prefix):
+    body = b'{"a": 1}'
+    assert monitoring._valid_signature(body, prefix + _sign(body))
+
+
+# ── Endpoint ────────────────────────────────────────────────────
+
+def test_bad_signature_returns_401(secret, client):
+    response = client.post(PATH, content=b"{}", headers={"X-Yutori-Signature": "nope"})
+    assert response.status_code == 401
+
+
+@pytest.mark.parametrize("body", [b"{not json", b"", b"[1, 2]", b'"text"'])
+def test_malformed_body_returns_400(client, body):
+    assert client.post(PATH, content=body).status_code == 400
+
+
+def test_signed_malformed_body_returns_400(secret, client):
+    body = b"{not json"
+    response = client.post(PATH, content=body, headers={"X-Yutori-Signature": _sign(body)})
+    assert response.status_code == 400
+
+
+def test_valid_payload_is_queued(app, client):
+    response = client.post(PATH, json={"task_id": "scout-1", "id": "u1"})
+    assert response.status_code == 202
+    assert app.state.mention_queue.get_nowait() == {"task_id": "scout-1", "id": "u1"}
+
+
+def test_full_queue_returns_503(app, client):
+    app.state.mention_queue.put_nowait({})
+    assert client.post(PATH, json={"id": "u1"}).status_code == 503
+
+
+def test_no_worker_returns_503(app, client):
+    del app.state.mention_queue
+    assert client.post(PATH, json={"id": "u1"}).status_code == 503
+
+
+# ── Scout mention shape ─────────────────────────────────────────
+
+def test_structured_mentions_get_indexed_update_ids():
+    update = {
+        "id": "u1",
+        "task_id": "scout-1",
+        "structured_result": {
+            "brand_mentions": [
+                {"claim": "first", "platform": "chatgpt"},
+                {"platform": "claude"},  # no claim: skipped, index kept
+                {"claim": "third"},
+            ]
+        },
+        "content": "raw text",
+    }
+    assert scout_mentions(update) == [
+        ("u1:0", {"claim": "first", "platform": "chatgpt"}),
+        ("u1:2", {"claim": "third"}),
+    ]
+
+
+def test_unstructured_update_falls_back_to_content():
+    assert scout_mentions({"id": "u1", "task_id": "scout-1", "content": "text"}) == [
+        ("u1", {"claim": "text"})
+    ]
+
+
+def test_scout_id_is_not_used_as_update_id():
+    assert scout_mentions({"id": "scout-1", "task_id": "scout-1", "content": "text"}) == [
+        (None, {"claim": "text"})
+    ]
@@ -0,0 +1,43 @@
+"""Tests for the in-memory agent task store and its status index."""
+from collections import defaultdict
+
+import pytest
+
+from app.services.agent import orchestrator
+from app.services.agent.orchestrator import get_task, list_tasks, store_task
+
+
+@pytest.fixture(autouse=True)
+def empty_store(monkeypatch):
+    monkeypatch.setattr(orchestrator, "_task_store", {})
+    monkeypatch.setattr(orchestrator, "_status_index", defaultdict(dict))
+    monkeypatch.setattr(orchestrator, "_task_status", {})
+
+
+def test_list_by_status_follows_restores():
+    store_task({"task_id": "t1", "status": "running"})
+    store_task({"task_id": "t2", "status": "running"})
+    store_task({"task_id": "t1", "status": "completed"})
+
+    assert [t["task_id"] for t in list_tasks("running")] == ["t2"]
+    assert [t["task_id"] for t in list_tasks("completed")] == ["t1"]
+    assert len(list_tasks()) == 2
+
+
+def test_in_place_mutation_then_restore_moves_index():
+    task = {"task_id": "t1", "status": "running"}
+    store_task(task)
+    task["status"] = "failed"
+    store_task(task)
+
+    assert list_tasks("running") == []
+    assert list_tasks("failed") == [task]
+    assert get_task("t1") is task
+
+
+def test_status_buckets_keep_insertion_order():
+    for i in range(5):
+        store_task({"task_id": f"t{i}", "status": "queued"})
+    store_task({"task_id": "t2", "status": "queued"})
+
+    assert [t["task_id"] for t in list_tasks("queued")] == ["t0", "t1", "t2", "t3", "t4"]